@@ -1,7 +1,8 @@
 """Error helpers for the pyCycle MCP server.
 
 Provides a typed container for MCP errors and helper utilities to keep
-responses consistent across tools.
+responses consistent across tools. The helpers build the response envelope
+directly; :class:`MCPError` is for callers that want a typed object.
 """
 
 from __future__ import annotations
@@ -9,7 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MCPError:
     """Structured MCP error payload.
 
@@ -47,10 +48,10 @@ def error_response(error_type: str, message: str, details: object | None = None)
         A mapping that matches the MCP error envelope.
     """
 
-    return MCPError(error_type=error_type, message=message, details=details).to_response()
+    return {"error": {"type": error_type, "message": message, "details": details}}
 
 
 def to_error(err: Exception) -> dict[str, object]:
     """Convert an exception into an MCP error response."""
 
-    return error_response(error_type=err.__class__.__name__, message=str(err))
+    return {"error": {"type": type(err).__name__, "message": str(err), "details": None}}
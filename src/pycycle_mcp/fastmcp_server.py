@@ -2,37 +2,41 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
+import os
+import sys
 from collections.abc import Callable
-from typing import Any, Literal, TypedDict, TypeVar, Unpack, cast
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Annotated, Any, Literal, TypedDict, TypeVar, Unpack, cast
 
-from fastmcp.server import FastMCP
-from fastmcp.tools.tool import FunctionTool
-from mcp.types import ToolAnnotations
-from pydantic import BaseModel
+from pydantic import VERSION as PYDANTIC_VERSION
+from pydantic import BaseModel, Field
 
-from . import tools
 from .schemas import (
+    MAX_PARALLEL_WORKERS,
     CloseCycleModelResponse,
-    ComputeTotalsRequest,
     ComputeTotalsResponse,
-    CreateCycleModelRequest,
     CreateCycleModelResponse,
     CycleSummaryResponse,
-    GetOutputsRequest,
     GetOutputsResponse,
-    ListVariablesRequest,
     ListVariablesResponse,
-    RunCycleRequest,
     RunCycleResponse,
-    SetInputsRequest,
     SetInputsResponse,
-    SweepInputsRequest,
     SweepInputsResponse,
     SweepVariable,
 )
 from .tools import PingResponse
 
+if TYPE_CHECKING:
+    from fastmcp.server import FastMCP
+    from mcp.types import ToolAnnotations
+
+    from . import tools
+
 __all__ = ["build_server", "tools"]
 
 LOGGER = logging.getLogger(__name__)
@@ -41,6 +45,16 @@ ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
 ToolFunc = Callable[..., dict[str, Any]]
 
 
+def __getattr__(name: str) -> ModuleType:
+    """Resolve the ``tools`` package lazily so importing this module stays cheap."""
+
+    if name == "tools":
+        from . import tools
+
+        return tools
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class ToolKwargs(TypedDict, total=False):
     """Subset of FastMCP tool configuration parameters used by this module."""
 
@@ -58,6 +72,102 @@ def _tool(server: FastMCP, **kwargs: Unpack[ToolKwargs]) -> Callable[[ToolFunc],
     return cast(Callable[[ToolFunc], ToolFunc], server.tool(**kwargs))
 
 
+_RESPONSE_MODELS: tuple[type[BaseModel], ...] = (
+    PingResponse,
+    CreateCycleModelResponse,
+    CloseCycleModelResponse,
+    CycleSummaryResponse,
+    ListVariablesResponse,
+    SetInputsResponse,
+    GetOutputsResponse,
+    RunCycleResponse,
+    SweepInputsResponse,
+    ComputeTotalsResponse,
+)
+
+
+def _schema_cache_path() -> Path | None:
+    """Return the on-disk schema cache file, keyed on the schema sources and pydantic version, or ``None`` if disabled."""
+
+    if os.environ.get("PYCYCLE_MCP_SCHEMA_CACHE", "1") == "0":
+        return None
+    root = os.environ.get("PYCYCLE_MCP_CACHE_DIR")
+    if not root:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(xdg_cache, "pycycle-mcp")
+
+    digest = hashlib.sha256(PYDANTIC_VERSION.encode())
+    try:
+        for module_name in sorted({model.__module__ for model in _RESPONSE_MODELS}):
+            module_file = getattr(sys.modules[module_name], "__file__", None)
+            if module_file is None:
+                return None
+            digest.update(Path(module_file).read_bytes())
+    except OSError:
+        return None
+    return Path(root) / f"schemas.{digest.hexdigest()[:16]}.json"
+
+
+@functools.cache
+def _schemas() -> dict[str, dict[str, Any]]:
+    """Return all response-model JSON Schemas keyed by class name, via the disk cache when available."""
+
+    path = _schema_cache_path()
+    if path is not None:
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = None
+        if isinstance(cached, dict) and all(model.__name__ in cached for model in _RESPONSE_MODELS):
+            return cast(dict[str, dict[str, Any]], cached)
+
+    schemas = {model.__name__: model.model_json_schema() for model in _RESPONSE_MODELS}
+    if path is not None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(schemas), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            LOGGER.debug("Could not write schema cache %s: %s", path, exc)
+    return schemas
+
+
+@functools.cache
+def _schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Return the JSON Schema for ``model``, computed once per process."""
+
+    schema = _schemas().get(model.__name__) if model in _RESPONSE_MODELS else None
+    return schema if schema is not None else model.model_json_schema()
+
+
+def _prewarm_schemas() -> None:
+    """Resolve every response schema in one pass (from the disk cache when enabled)."""
+
+    for model in _RESPONSE_MODELS:
+        _schema(model)
+
+
+@functools.cache
+def _tool_annotations() -> dict[str, ToolAnnotations]:
+    """Build the per-tool MCP annotations once; ``mcp.types`` is imported on first use."""
+
+    from mcp.types import ToolAnnotations
+
+    return {
+        "ping": ToolAnnotations(title="Ping", readOnlyHint=True),
+        "create_cycle_model": ToolAnnotations(title="Create cycle model"),
+        "close_cycle_model": ToolAnnotations(title="Close cycle model", destructiveHint=True),
+        "get_cycle_summary": ToolAnnotations(title="Get cycle summary", readOnlyHint=True),
+        "list_variables": ToolAnnotations(title="List variables", readOnlyHint=True),
+        "set_inputs": ToolAnnotations(title="Set inputs"),
+        "get_outputs": ToolAnnotations(title="Get outputs", readOnlyHint=True),
+        "run_cycle": ToolAnnotations(title="Run cycle"),
+        "sweep_inputs": ToolAnnotations(title="Sweep inputs"),
+        "compute_totals": ToolAnnotations(title="Compute totals", readOnlyHint=True),
+    }
+
+
 def _validated_response(response: dict[str, Any], response_model: type[ResponseModel]) -> dict[str, Any]:
     """Validate and normalize a tool response using a Pydantic model."""
 
@@ -68,13 +178,19 @@ def _validated_response(response: dict[str, Any], response_model: type[ResponseM
 def _register_tools(server: FastMCP) -> None:
     """Attach the pyCycle tool implementations to a FastMCP instance."""
 
+    from fastmcp.tools.tool import FunctionTool
+
+    from . import tools
+
+    annotations = _tool_annotations()
+
     server.add_tool(
         FunctionTool.from_function(
             tools.ping,
             name="ping",
             description="Simple healthcheck for the pyCycle MCP server.",
-            annotations=ToolAnnotations(title="Ping", readOnlyHint=True),
-            output_schema=PingResponse.model_json_schema(),
+            annotations=annotations["ping"],
+            output_schema=_schema(PingResponse),
         )
     )
 
@@ -83,8 +199,8 @@ def _register_tools(server: FastMCP) -> None:
         name="create_cycle_model",
         description="Instantiate a pyCycle/OpenMDAO Problem for a specified engine cycle.",
         tags={"pycycle", "model"},
-        output_schema=CreateCycleModelResponse.model_json_schema(),
-        annotations=ToolAnnotations(title="Create cycle model"),
+        output_schema=_schema(CreateCycleModelResponse),
+        annotations=annotations["create_cycle_model"],
     )
     def create_cycle_model_tool(
         cycle_type: str,
@@ -92,13 +208,14 @@ def _register_tools(server: FastMCP) -> None:
         options: dict[str, Any] | None = None,
         cycle_module_path: str | None = None,
     ) -> dict[str, Any]:
-        request = CreateCycleModelRequest(
-            cycle_type=cycle_type,
-            mode=mode,
-            options=options or {},
-            cycle_module_path=cycle_module_path,
+        response = tools.create_model.create_cycle_model(
+            {
+                "cycle_type": cycle_type,
+                "mode": mode,
+                "options": options or {},
+                "cycle_module_path": cycle_module_path,
+            }
         )
-        response = tools.create_model.create_cycle_model(request.model_dump(exclude_none=True))
         return _validated_response(response, CreateCycleModelResponse)
 
     @_tool(
@@ -106,8 +223,8 @@ def _register_tools(server: FastMCP) -> None:
         name="close_cycle_model",
         description="Close a pyCycle session and free resources.",
         tags={"pycycle", "session"},
-        output_schema=CloseCycleModelResponse.model_json_schema(),
-        annotations=ToolAnnotations(title="Close cycle model", destructiveHint=True),
+        output_schema=_schema(CloseCycleModelResponse),
+        annotations=annotations["close_cycle_model"],
     )
     def close_cycle_model_tool(session_id: str) -> dict[str, Any]:
         response = tools.create_model.close_cycle_model({"session_id": session_id})
@@ -118,8 +235,8 @@ def _register_tools(server: FastMCP) -> None:
         name="get_cycle_summary",
         description="Return a succinct summary of the current cycle model.",
         tags={"pycycle", "summary"},
-        output_schema=CycleSummaryResponse.model_json_schema(),
-        annotations=ToolAnnotations(title="Get cycle summary", readOnlyHint=True),
+        output_schema=_schema(CycleSummaryResponse),
+        annotations=annotations["get_cycle_summary"],
     )
     def get_cycle_summary_tool(session_id: str) -> dict[str, Any]:
         response = tools.create_model.get_cycle_summary({"session_id": session_id})
@@ -130,8 +247,8 @@ def _register_tools(server: FastMCP) -> None:
         name="list_variables",
         description="List variables in the cycle model.",
         tags={"pycycle", "variables"},
-        output_schema=ListVariablesResponse.model_json_schema(),
-        annotations=ToolAnnotations(title="List variables", readOnlyHint=True),
+        output_schema=_schema(ListVariablesResponse),
+        annotations=annotations["list_variables"],
     )
     def list_variables_tool(
         session_id: str,
@@ -140,14 +257,15 @@ def _register_tools(server: FastMCP) -> None:
         name_filter: str | None = None,
         max_variables: int = 200,
     ) -> dict[str, Any]:
-        request = ListVariablesRequest(
-            session_id=session_id,
-            kind=kind,
-            promoted_only=promoted_only,
-            name_filter=name_filter,
-            max_variables=max_variables,
+        response = tools.variables.list_variables(
+            {
+                "session_id": session_id,
+                "kind": kind,
+                "promoted_only": promoted_only,
+                "name_filter": name_filter,
+                "max_variables": max_variables,
+            }
         )
-        response = tools.variables.list_variables(request.model_dump(exclude_none=True))
         return _validated_response(response, ListVariablesResponse)
 
     @_tool(
@@ -155,16 +273,17 @@ def _register_tools(server: FastMCP) -> None:
         name="set_inputs",
         description="Set one or more input variables in the cycle model.",
         tags={"pycycle", "variables"},
-        output_schema=SetInputsResponse.model_json_schema(),
-        annotations=ToolAnnotations(title="Set inputs"),
+        output_schema=_schema(SetInputsResponse),
+        annotations=annotations["set_inputs"],
     )
     def set_inputs_tool(
         session_id: str,
         values: dict[str, Any],
         allow_missing: bool = False,
     ) -> dict[str, Any]:
-        request = SetInputsRequest(session_id=session_id, values=values, allow_missing=allow_missing)
-        response = tools.variables.set_inputs(request.model_dump())
+        response = tools.variables.set_inputs(
+            {"session_id": session_id, "values": values, "allow_missing": allow_missing}
+        )
         return _validated_response(response, SetInputsResponse)
 
     @_tool(
@@ -172,16 +291,17 @@ def _register_tools(server: FastMCP) -> None:
         name="get_outputs",
         description="Fetch values for one or more outputs after a run.",
         tags={"pycycle", "variables"},
-        output_schema=GetOutputsResponse.model_json_schema(),
-        annotations=ToolAnnotations(title="Get outputs", readOnlyHint=True),
+        output_schema=_schema(GetOutputsResponse),
+        annotations=annotations["get_outputs"],
     )
     def get_outputs_tool(
         session_id: str,
         names: list[str],
         allow_missing: bool = False,
     ) -> dict[str, Any]:
-        request = GetOutputsRequest(session_id=session_id, names=names, allow_missing=allow_missing)
-        response = tools.variables.get_outputs(request.model_dump())
+        response = tools.variables.get_outputs(
+            {"session_id": session_id, "names": names, "allow_missing": allow_missing}
+        )
         return _validated_response(response, GetOutputsResponse)
 
     @_tool(
@@ -189,20 +309,21 @@ def _register_tools(server: FastMCP) -> None:
         name="run_cycle",
         description="Run the cycle model and return selected outputs.",
         tags={"pycycle", "execution"},
-        output_schema=RunCycleResponse.model_json_schema(),
-        annotations=ToolAnnotations(title="Run cycle"),
+        output_schema=_schema(RunCycleResponse),
+        annotations=annotations["run_cycle"],
     )
     def run_cycle_tool(
         session_id: str,
         outputs_of_interest: list[str] | None = None,
         use_driver: bool = False,
     ) -> dict[str, Any]:
-        request = RunCycleRequest(
-            session_id=session_id,
-            outputs_of_interest=outputs_of_interest or [],
-            use_driver=use_driver,
+        response = tools.execution.run_cycle(
+            {
+                "session_id": session_id,
+                "outputs_of_interest": outputs_of_interest or [],
+                "use_driver": use_driver,
+            }
         )
-        response = tools.execution.run_cycle(request.model_dump())
         return _validated_response(response, RunCycleResponse)
 
     @_tool(
@@ -210,8 +331,8 @@ def _register_tools(server: FastMCP) -> None:
         name="sweep_inputs",
         description="Perform a parametric sweep over input variables.",
         tags={"pycycle", "sweep"},
-        output_schema=SweepInputsResponse.model_json_schema(),
-        annotations=ToolAnnotations(title="Sweep inputs"),
+        output_schema=_schema(SweepInputsResponse),
+        annotations=annotations["sweep_inputs"],
     )
     def sweep_inputs_tool(
         session_id: str,
@@ -219,15 +340,20 @@ def _register_tools(server: FastMCP) -> None:
         outputs_of_interest: list[str] | None = None,
         use_driver: bool = False,
         skip_on_failure: bool = True,
+        parallel_workers: Annotated[int, Field(ge=1, le=MAX_PARALLEL_WORKERS)] = 1,
+        reset_between_points: bool = True,
     ) -> dict[str, Any]:
-        request = SweepInputsRequest(
-            session_id=session_id,
-            sweep=sweep,
-            outputs_of_interest=outputs_of_interest or [],
-            use_driver=use_driver,
-            skip_on_failure=skip_on_failure,
+        response = tools.sweep.sweep_inputs(
+            {
+                "session_id": session_id,
+                "sweep": [entry.model_dump() for entry in sweep],
+                "outputs_of_interest": outputs_of_interest or [],
+                "use_driver": use_driver,
+                "skip_on_failure": skip_on_failure,
+                "parallel_workers": parallel_workers,
+                "reset_between_points": reset_between_points,
+            }
         )
-        response = tools.sweep.sweep_inputs(request.model_dump())
         return _validated_response(response, SweepInputsResponse)
 
     @_tool(
@@ -235,28 +361,27 @@ def _register_tools(server: FastMCP) -> None:
         name="compute_totals",
         description="Compute total derivatives using OpenMDAO.",
         tags={"pycycle", "derivatives"},
-        output_schema=ComputeTotalsResponse.model_json_schema(),
-        annotations=ToolAnnotations(title="Compute totals", readOnlyHint=True),
+        output_schema=_schema(ComputeTotalsResponse),
+        annotations=annotations["compute_totals"],
     )
     def compute_totals_tool(
         session_id: str,
         of: list[str],
         wrt: list[str],
-        return_format: Literal["by_pair", "dense"] = "by_pair",
+        return_format: Literal["by_pair", "dense", "dense_base64"] = "by_pair",
     ) -> dict[str, Any]:
-        request = ComputeTotalsRequest(
-            session_id=session_id,
-            of=of,
-            wrt=wrt,
-            return_format=return_format,
+        response = tools.derivatives.compute_totals(
+            {"session_id": session_id, "of": of, "wrt": wrt, "return_format": return_format}
         )
-        response = tools.derivatives.compute_totals(request.model_dump())
         return _validated_response(response, ComputeTotalsResponse)
 
 
 def build_server() -> FastMCP:
     """Construct a FastMCP server with all pyCycle tools registered."""
 
+    _prewarm_schemas()
+    from fastmcp.server import FastMCP
+
     server = FastMCP(
         name="pycycle-mcp",
         instructions=("Expose pyCycle/OpenMDAO utilities for creating and running engine cycle models."),
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import argparse
+import functools
 from collections.abc import Sequence
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
-from pycycle_mcp.fastmcp_server import build_server
+if TYPE_CHECKING:
+    from fastmcp.server import FastMCP
 
 TransportName = Literal["stdio", "http", "sse", "streamable-http"]
 
@@ -46,6 +48,20 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.cache
+def _shared_parser() -> argparse.ArgumentParser:
+    """Parser reused by every :func:`main` call; parsing does not mutate it."""
+    return build_parser()
+
+
+def build_server() -> FastMCP:
+    """Build the FastMCP app, importing the server module only when needed."""
+
+    from pycycle_mcp.fastmcp_server import build_server as _build_server
+
+    return _build_server()
+
+
 def _normalize_transport(transport: TransportName) -> TransportName:
     """Normalize legacy HTTP aliasing used by existing integrations."""
     if transport == "http":
@@ -55,10 +71,8 @@ def _normalize_transport(transport: TransportName) -> TransportName:
 
 def main(argv: Sequence[str] | None = None) -> int:
     """Register tools and start the FastMCP server."""
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    args = _shared_parser().parse_args(argv)
 
-    app = build_server()
     transport = _normalize_transport(cast(TransportName, args.transport))
 
     transport_kwargs: dict[str, Any] = {
@@ -71,6 +85,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         if args.path is not None:
             transport_kwargs["path"] = args.path
 
+    app = build_server()
     app.run(transport=transport, **transport_kwargs)
     return 0
 
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import queue
 from dataclasses import dataclass
-from typing import Literal
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Literal
 
-from fastmcp.server import FastMCP
+if TYPE_CHECKING:
+    from fastmcp.server import FastMCP
 
 
 @dataclass
@@ -19,13 +24,26 @@ class ServerSettings:
     show_banner: bool = False
 
 
-def configure_logging(level: int | str = logging.INFO) -> None:
-    """Initialize logging for CLI and server runs."""
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-    )
+
+def configure_logging(level: int | str = logging.INFO) -> None:
+    """Initialize logging for CLI and server runs; records are written to stderr from a background thread."""
+
+    if os.environ.get("PYCYCLE_MCP_LOG_UNBUFFERED") == "1":
+        logging.basicConfig(level=level, format=LOG_FORMAT)
+        return
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    logging.basicConfig(level=level, format=LOG_FORMAT, handlers=[queue_handler])
+    if queue_handler not in logging.getLogger().handlers:
+        # Logging was already configured; basicConfig left it untouched.
+        return
+
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def run_server(server: FastMCP, settings: ServerSettings) -> None:
@@ -10,6 +10,9 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+MAX_PARALLEL_WORKERS = 32
+"""Upper bound on ``sweep_inputs`` worker processes; the sweep also caps them at ``os.cpu_count()``."""
+
 
 class ToolError(BaseModel):
     """Structured error envelope shared by all tool responses."""
@@ -170,6 +173,8 @@ class SweepInputsRequest(BaseModel):
     outputs_of_interest: list[str] = Field(default_factory=list)
     use_driver: bool = False
     skip_on_failure: bool = True
+    parallel_workers: int = Field(default=1, ge=1, le=MAX_PARALLEL_WORKERS)
+    reset_between_points: bool = True
 
     model_config = ConfigDict(extra="forbid")
 
@@ -180,6 +185,7 @@ class SweepResult(BaseModel):
     inputs: dict[str, Any] = Field(default_factory=dict)
     success: bool
     outputs: dict[str, Any] = Field(default_factory=dict)
+    messages: list[str] = Field(default_factory=list)
     error_message: str | None = None
 
     model_config = ConfigDict(extra="ignore")
@@ -197,7 +203,7 @@ class ComputeTotalsRequest(BaseModel):
     session_id: str
     of: list[str]
     wrt: list[str]
-    return_format: Literal["by_pair", "dense"] = "by_pair"
+    return_format: Literal["by_pair", "dense", "dense_base64"] = "by_pair"
 
     model_config = ConfigDict(extra="forbid")
 
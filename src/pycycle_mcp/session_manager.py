@@ -2,46 +2,198 @@
 
 from __future__ import annotations
 
-import uuid
+import itertools
+import logging
+import os
+import secrets
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
 
 from .types import CycleProblem
 
+LOGGER = logging.getLogger(__name__)
 
-@dataclass
+DEFAULT_MAX_SESSIONS = 32
+"""Default number of live sessions kept before the least recently used is evicted."""
+
+TOTALS_CACHE_SIZE = 16
+"""Number of ``(of, wrt)`` Jacobians memoized per session for its converged state."""
+
+
+VariableList = list[tuple[str, dict[str, object]]]
+
+
+def list_model_variables(problem: CycleProblem, target: str) -> VariableList:
+    """List a model's promoted ``"inputs"`` or ``"outputs"`` with their metadata."""
+
+    if target == "inputs":
+        items = problem.model.list_inputs(prom_name=True, out_stream=None)
+    else:
+        items = problem.model.list_outputs(prom_name=True, out_stream=None)
+    return [(name, meta) for name, meta in items]
+
+
+@dataclass(slots=True)
 class SessionRecord:
-    """Container for an OpenMDAO Problem and metadata."""
+    """Container for an OpenMDAO Problem, its metadata and its per-session caches."""
 
     problem: CycleProblem
     meta: dict[str, object] = field(default_factory=dict)
+    variables: dict[str, VariableList] = field(default_factory=dict)
+    totals: OrderedDict[Hashable, dict[tuple[str, str], object]] = field(default_factory=OrderedDict)
+    inputs_generation: int = 0
+    last_run_generation: int | None = None
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False, compare=False)
+
+    def variable_listing(self, target: str) -> VariableList:
+        """Return the cached listing for ``"inputs"``/``"outputs"``, building it on first use."""
+
+        with self._lock:
+            listing = self.variables.get(target)
+            if listing is None:
+                listing = self.variables[target] = list_model_variables(self.problem, target)
+            return listing
+
+    def totals_for(
+        self, of: list[str], wrt: list[str], compute: Callable[[], dict[tuple[str, str], object]]
+    ) -> tuple[dict[tuple[str, str], object], bool]:
+        """Return the Jacobian for ``of``/``wrt`` and whether it came from the cache of the current solve."""
+
+        with self._lock:
+            generation = self.last_run_generation
+            if generation is None or generation != self.inputs_generation:
+                return compute(), False
+            key = (generation, tuple(of), tuple(wrt))
+            totals = self.totals.get(key)
+            if totals is not None:
+                self.totals.move_to_end(key)
+                return totals, True
+            totals = self.totals[key] = compute()
+            while len(self.totals) > TOTALS_CACHE_SIZE:
+                self.totals.popitem(last=False)
+            return totals, False
+
+    def mark_inputs_changed(self) -> None:
+        """Note that an input was just assigned on the problem and drop stale caches."""
+
+        with self._lock:
+            self.inputs_generation += 1
+            self.invalidate_variables()
+
+    def invalidate_variables(self) -> None:
+        """Drop cached variable listings and totals after the problem's values change."""
+
+        with self._lock:
+            self.variables.clear()
+            self.totals.clear()
+
+    def reset(self) -> None:
+        """Drop every cache and the solve bookkeeping, as if the session were new."""
+
+        with self._lock:
+            self.invalidate_variables()
+            self.inputs_generation = 0
+            self.last_run_generation = None
+
+
+CloseCallback = Callable[[str, SessionRecord], None]
+
+
+def _max_sessions_from_env() -> int:
+    """Read ``PYCYCLE_MCP_MAX_SESSIONS``, falling back to the default on invalid values."""
+
+    raw = os.environ.get("PYCYCLE_MCP_MAX_SESSIONS")
+    if raw is None or not raw.strip():
+        return DEFAULT_MAX_SESSIONS
+    try:
+        value = int(raw)
+    except ValueError:
+        value = -1
+    if value < 0:
+        LOGGER.warning(
+            "Ignoring invalid PYCYCLE_MCP_MAX_SESSIONS=%r (expected an integer >= 0); using %d",
+            raw,
+            DEFAULT_MAX_SESSIONS,
+        )
+        return DEFAULT_MAX_SESSIONS
+    return value
+
+
+def release_problem(session_id: str, record: SessionRecord) -> None:
+    """Release resources held by a session's problem (OpenMDAO ``Problem.cleanup``)."""
+
+    cleanup = getattr(record.problem, "cleanup", None)
+    if not callable(cleanup):
+        return
+    try:
+        cleanup()
+    except Exception as exc:
+        LOGGER.debug("Cleanup of session %s failed: %s", session_id, exc)
 
 
 class SessionManager:
-    """Manage pyCycle/OpenMDAO Problem sessions keyed by UUID."""
+    """Manage pyCycle/OpenMDAO Problem sessions keyed by opaque identifiers, evicting the least recently used."""
 
-    def __init__(self) -> None:
-        self._sessions: dict[str, SessionRecord] = {}
+    def __init__(self, max_sessions: int | None = None, on_close: CloseCallback | None = None) -> None:
+        if max_sessions is None:
+            max_sessions = _max_sessions_from_env()
+        self._sessions: OrderedDict[str, SessionRecord] = OrderedDict()
+        self._max_sessions = max_sessions
+        self._on_close = on_close or release_problem
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
 
     def create_session(self, problem: CycleProblem, meta: dict[str, object] | None = None) -> str:
         """Register a new session and return its identifier."""
 
-        session_id = str(uuid.uuid4())
-        self._sessions[session_id] = SessionRecord(problem=problem, meta=meta or {})
+        evicted: list[tuple[str, SessionRecord]] = []
+        with self._lock:
+            session_id = f"s{next(self._counter):x}{secrets.token_hex(8)}"
+            self._sessions[session_id] = SessionRecord(problem=problem, meta=meta or {})
+            while 0 < self._max_sessions < len(self._sessions):
+                evicted.append(self._sessions.popitem(last=False))
+
+        for evicted_id, record in evicted:
+            LOGGER.warning(
+                "Evicting least recently used session %s (limit of %d live sessions reached)",
+                evicted_id,
+                self._max_sessions,
+            )
+            self._on_close(evicted_id, record)
         return session_id
 
+    def get_record(self, session_id: str) -> SessionRecord:
+        """Retrieve the full record for a session, marking it as recently used."""
+
+        with self._lock:
+            try:
+                record = self._sessions[session_id]
+            except KeyError:
+                raise KeyError(f"Unknown session_id: {session_id}") from None
+            self._sessions.move_to_end(session_id)
+        return record
+
     def get(self, session_id: str) -> tuple[CycleProblem, dict[str, object]]:
         """Retrieve the problem and metadata for a session."""
 
-        record = self._sessions.get(session_id)
-        if record is None:
-            raise KeyError(f"Unknown session_id: {session_id}")
+        record = self.get_record(session_id)
         return record.problem, record.meta
 
+    def session_ids(self) -> list[str]:
+        """Return the live session identifiers, least recently used first."""
+
+        with self._lock:
+            return list(self._sessions)
+
     def close(self, session_id: str) -> None:
-        """Remove a session."""
+        """Remove a session and release its resources."""
 
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        with self._lock:
+            record = self._sessions.pop(session_id, None)
+        if record is not None:
+            self._on_close(session_id, record)
 
 
 session_manager = SessionManager()
@@ -1,11 +1,23 @@
-"""Tool collection for the pyCycle MCP server."""
+"""Tool collection for the pyCycle MCP server.
+
+Tool implementations are imported on first attribute access so that loading
+the package (for example to register ``ping``) does not pull in numpy or the
+pyCycle/OpenMDAO-backed tool modules.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
 
-from .create_model import close_cycle_model, create_cycle_model, get_cycle_summary
-from .derivatives import compute_totals
-from .execution import run_cycle
 from .ping import PingRequest, PingResponse, ping
-from .sweep import sweep_inputs
-from .variables import get_outputs, list_variables, set_inputs
+
+if TYPE_CHECKING:
+    from .create_model import close_cycle_model, create_cycle_model, get_cycle_summary
+    from .derivatives import compute_totals
+    from .execution import run_cycle
+    from .sweep import sweep_inputs
+    from .variables import get_outputs, list_variables, set_inputs
 
 __all__ = [
     "create_cycle_model",
@@ -21,3 +33,30 @@ __all__ = [
     "PingRequest",
     "PingResponse",
 ]
+
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "create_cycle_model": ("create_model", "create_cycle_model"),
+    "close_cycle_model": ("create_model", "close_cycle_model"),
+    "get_cycle_summary": ("create_model", "get_cycle_summary"),
+    "list_variables": ("variables", "list_variables"),
+    "set_inputs": ("variables", "set_inputs"),
+    "get_outputs": ("variables", "get_outputs"),
+    "run_cycle": ("execution", "run_cycle"),
+    "sweep_inputs": ("sweep", "sweep_inputs"),
+    "compute_totals": ("derivatives", "compute_totals"),
+}
+_LAZY_SUBMODULES = frozenset({"create_model", "derivatives", "execution", "sweep", "variables"})
+
+
+def __getattr__(name: str) -> object:
+    """Import tool modules and functions on first access (PEP 562)."""
+
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    try:
+        module_name, attr = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
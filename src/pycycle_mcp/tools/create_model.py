@@ -3,21 +3,24 @@
 from __future__ import annotations
 
 import logging
+import re
 from collections.abc import Callable
 
 from ..errors import error_response, to_error
-from ..session_manager import session_manager
+from ..session_manager import SessionRecord, VariableList, session_manager
 from ..types import CycleProblem
 from ..utils import (
     error_on_missing_session,
+    keyword_pattern,
     load_callable,
-    select_interesting_variables,
 )
 
 LOGGER = logging.getLogger(__name__)
 
 INTERESTING_INPUT_KEYWORDS = ["mach", "alt", "pr", "turbine", "throttle"]
 INTERESTING_OUTPUT_KEYWORDS = ["fn", "fnet", "thrust", "tsfc", "power", "eff"]
+_INPUT_RE = keyword_pattern(INTERESTING_INPUT_KEYWORDS)
+_OUTPUT_RE = keyword_pattern(INTERESTING_OUTPUT_KEYWORDS)
 
 
 CycleBuilder = Callable[[], object]
@@ -115,32 +118,19 @@ def _apply_design_defaults(problem: CycleProblem, model: object, mode: str) -> N
         problem["fc.balance.Tt"] = 518.67
 
 
-def _extract_variables(problem: CycleProblem, target: str) -> list[tuple[str, dict[str, object]]]:
-    if target == "inputs":
-        items = problem.model.list_inputs(prom_name=True, out_stream=None)
-    else:
-        items = problem.model.list_outputs(prom_name=True, out_stream=None)
-    return [(name, meta) for name, meta in items]
+def _summarize_variables(record: SessionRecord) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
+    inputs = record.variable_listing("inputs")
+    outputs = record.variable_listing("outputs")
 
+    def _render(source: VariableList, pattern: re.Pattern[str]) -> list[dict[str, object]]:
+        search = pattern.search
+        return [
+            {"name": name, "units": meta.get("units"), "desc": meta.get("desc")}
+            for name, meta in source
+            if search(name.lower())
+        ]
 
-def _summarize_variables(
-    problem: CycleProblem,
-) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
-    inputs = _extract_variables(problem, "inputs")
-    outputs = _extract_variables(problem, "outputs")
-
-    interesting_inputs = select_interesting_variables(inputs, INTERESTING_INPUT_KEYWORDS)
-    interesting_outputs = select_interesting_variables(outputs, INTERESTING_OUTPUT_KEYWORDS)
-
-    def _render(names: list[str], source: list[tuple[str, dict[str, object]]]) -> list[dict[str, object]]:
-        rendered: list[dict[str, object]] = []
-        metadata_map = {name: meta for name, meta in source}
-        for name in names:
-            meta = metadata_map.get(name, {})
-            rendered.append({"name": name, "units": meta.get("units"), "desc": meta.get("desc")})
-        return rendered
-
-    return _render(interesting_inputs, inputs), _render(interesting_outputs, outputs)
+    return _render(inputs, _INPUT_RE), _render(outputs, _OUTPUT_RE)
 
 
 def create_cycle_model(payload: dict[str, object]) -> dict[str, object]:
@@ -165,7 +155,7 @@ def create_cycle_model(payload: dict[str, object]) -> dict[str, object]:
 
         problem, resolved_name = _build_problem(builder=builder, mode=str(mode), options=options)
         session_id = session_manager.create_session(problem=problem, meta={"mode": mode, "options": options})
-        top_inputs, top_outputs = _summarize_variables(problem)
+        top_inputs, top_outputs = _summarize_variables(session_manager.get_record(session_id))
 
         return {
             "session_id": session_id,
@@ -200,26 +190,23 @@ def get_cycle_summary(payload: dict[str, object]) -> dict[str, object]:
         return error_response("ValidationError", "session_id is required")
 
     try:
-        problem, meta = session_manager.get(str(session_id))
+        record = session_manager.get_record(str(session_id))
+        problem, meta = record.problem, record.meta
         mode = meta.get("mode")
         options = meta.get("options", {})
-        inputs = _extract_variables(problem, "inputs")
-        outputs = _extract_variables(problem, "outputs")
-
-        def _populate(
-            entries: list[tuple[str, dict[str, object]]],
-        ) -> list[dict[str, object]]:
-            rendered: list[dict[str, object]] = []
-            for name, meta_entry in entries:
-                rendered.append(
-                    {
-                        "name": name,
-                        "units": meta_entry.get("units"),
-                        "desc": meta_entry.get("desc"),
-                        "current_value": meta_entry.get("val") or meta_entry.get("value"),
-                    }
-                )
-            return rendered
+        inputs = record.variable_listing("inputs")
+        outputs = record.variable_listing("outputs")
+
+        def _populate(entries: VariableList) -> list[dict[str, object]]:
+            return [
+                {
+                    "name": name,
+                    "units": meta_entry.get("units"),
+                    "desc": meta_entry.get("desc"),
+                    "current_value": meta_entry.get("val", meta_entry.get("value")),
+                }
+                for name, meta_entry in entries
+            ]
 
         return {
             "model_name": getattr(problem.model, "name", "cycle"),
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import base64
 from typing import cast
 
+import numpy as np
+
 from ..errors import error_response, to_error
 from ..session_manager import session_manager
 from ..utils import error_on_missing_session
@@ -14,10 +17,35 @@ def _format_by_pair(
 ) -> dict[str, dict[str, object]]:
     formatted: dict[str, dict[str, object]] = {}
     for (of, wrt), value in jacobian.items():
-        formatted.setdefault(of, {})[wrt] = value.tolist() if hasattr(value, "tolist") else value
+        row = formatted.get(of)
+        if row is None:
+            row = formatted[of] = {}
+        row[wrt] = value.tolist() if isinstance(value, np.ndarray) else value
     return formatted
 
 
+def _format_dense(
+    jacobian: dict[tuple[str, str], object], of: list[str], wrt: list[str], as_base64: bool
+) -> dict[str, object]:
+    """Assemble the Jacobian blocks into one matrix (rows follow ``of``, columns follow ``wrt``)."""
+
+    blocks = [[np.atleast_2d(np.asarray(jacobian[(o, w)], dtype=np.float64)) for w in wrt] for o in of]
+    matrix = np.block(blocks)
+    dense: dict[str, object] = {
+        "of": of,
+        "wrt": wrt,
+        "of_sizes": [row[0].shape[0] for row in blocks],
+        "wrt_sizes": [block.shape[1] for block in blocks[0]],
+        "shape": list(matrix.shape),
+    }
+    if as_base64:
+        dense["dtype"] = "<f8"
+        dense["data_b64"] = base64.b64encode(matrix.astype("<f8", copy=False).tobytes()).decode("ascii")
+    else:
+        dense["data"] = matrix.tolist()
+    return dense
+
+
 def compute_totals(payload: dict[str, object]) -> dict[str, object]:
     """Compute total derivatives using OpenMDAO."""
 
@@ -32,22 +60,17 @@ def compute_totals(payload: dict[str, object]) -> dict[str, object]:
         return error_response("ValidationError", "of and wrt must be provided")
 
     try:
-        problem, _ = session_manager.get(str(session_id))
-        totals = problem.compute_totals(of=of, wrt=wrt)
-
-        if return_format == "dense":
-            data = []
-            for output_name in of:
-                row = []
-                for input_name in wrt:
-                    cell = totals[(output_name, input_name)]
-                    row.append(cell.tolist() if hasattr(cell, "tolist") else cell)
-                data.append(row)
-            jacobian: dict[str, object] = {"of": of, "wrt": wrt, "data": data}
+        record = session_manager.get_record(str(session_id))
+        problem = record.problem
+        totals, reused = record.totals_for(of, wrt, lambda: problem.compute_totals(of=of, wrt=wrt))
+        message = "Reused cached totals" if reused else "Totals computed"
+
+        if return_format in ("dense", "dense_base64"):
+            jacobian = _format_dense(totals, of, wrt, as_base64=return_format == "dense_base64")
         else:
             jacobian = cast(dict[str, object], _format_by_pair(totals))
 
-        return {"jacobian": jacobian, "messages": ["Totals computed"]}
+        return {"jacobian": jacobian, "messages": [message]}
     except KeyError as exc:
         return error_on_missing_session(str(session_id), exc)
     except Exception as exc:  # pragma: no cover
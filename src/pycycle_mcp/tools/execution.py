@@ -47,19 +47,29 @@ def run_cycle(payload: dict[str, object]) -> dict[str, object]:
         return error_response("ValidationError", "session_id is required")
 
     try:
-        problem, _ = session_manager.get(str(session_id))
+        record = session_manager.get_record(str(session_id))
+        problem = record.problem
+        state_is_current = not use_driver and record.last_run_generation == record.inputs_generation
+
         messages: list[str] = []
-        try:
-            problem.set_solver_print(level=-1)
-            if use_driver:
-                messages.append("Ran driver")
-                problem.run_driver()
-            else:
-                messages.append("Ran model")
-                problem.run_model()
-        except Exception as exc:
-            LOGGER.error("Run failed: %s", exc)
-            return to_error(exc)
+        if state_is_current:
+            messages.append("Model inputs unchanged since last run")
+        else:
+            record.last_run_generation = None
+            try:
+                problem.set_solver_print(level=-1)
+                if use_driver:
+                    messages.append("Ran driver")
+                    problem.run_driver()
+                else:
+                    messages.append("Ran model")
+                    problem.run_model()
+                    record.last_run_generation = record.inputs_generation
+            except Exception as exc:
+                LOGGER.error("Run failed: %s", exc)
+                return to_error(exc)
+            finally:
+                record.invalidate_variables()
 
         outputs: dict[str, object | None] = {}
         for name in outputs_of_interest:
@@ -25,5 +25,4 @@ class PingResponse(BaseModel):
 def ping(args: PingRequest | None = None) -> PingResponse:
     """Return a simple health response without importing heavy dependencies."""
 
-    args = args or PingRequest()
-    return PingResponse(message=args.message)
+    return PingResponse(message=args.message if args is not None else None)
@@ -2,11 +2,190 @@
 
 from __future__ import annotations
 
+import copy
+import logging
+import math
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+
 from ..errors import error_response, to_error
-from ..session_manager import session_manager
+from ..schemas import MAX_PARALLEL_WORKERS
+from ..session_manager import SessionRecord, session_manager
+from ..types import CycleProblem
 from ..utils import error_on_missing_session, ordered_cartesian_product
 from .execution import run_cycle
 
+LOGGER = logging.getLogger(__name__)
+
+OutputSeed = np.ndarray | dict[str, object]
+"""Model output values assigned before a point to reset its solver seed: OpenMDAO's whole
+output vector, or values keyed by output name for other problems."""
+
+_WORKER_SESSION: str | None = None
+"""Worker-local session holding the unpickled problem, installed by :func:`_init_worker`."""
+
+_WORKER_SEED: OutputSeed | None = None
+"""Output values restored before each point in a worker, or ``None``."""
+
+
+def _output_vector(problem: CycleProblem) -> Any:
+    """OpenMDAO's ``model._outputs`` vector, or ``None`` for problems without one."""
+
+    return getattr(problem.model, "_outputs", None)
+
+
+def _snapshot_outputs(record: SessionRecord) -> OutputSeed | None:
+    """Copy the model's output values (the solver seed), or ``None`` if they are unavailable."""
+
+    problem = record.problem
+    try:
+        vector = _output_vector(problem)
+        if vector is not None:
+            values: np.ndarray = vector.asarray()
+            return values.copy()
+        names = [name for name, _ in record.variable_listing("outputs")]
+        seed = {name: copy.deepcopy(problem.get_val(name)) for name in names}
+    except Exception as exc:
+        LOGGER.info("Output values unavailable, sweeping without seed reset: %s", exc)
+        return None
+    return seed or None
+
+
+def _restore_outputs(problem: CycleProblem, seed: OutputSeed) -> None:
+    """Write a seed taken by :func:`_snapshot_outputs` back as the next solve's initial guess."""
+
+    if isinstance(seed, np.ndarray):
+        _output_vector(problem).set_val(seed)
+        return
+    for name, value in seed.items():
+        problem.set_val(name, value)
+
+
+def _init_worker(problem_snapshot: bytes, reset_between_points: bool) -> None:
+    """Unpickle the session's problem once per worker process into a worker-local session."""
+
+    global _WORKER_SESSION, _WORKER_SEED
+    _WORKER_SESSION = session_manager.create_session(pickle.loads(problem_snapshot))
+    record = session_manager.get_record(_WORKER_SESSION)
+    _WORKER_SEED = _snapshot_outputs(record) if reset_between_points else None
+
+
+def _sweep_point(
+    session_id: str,
+    input_values: dict[str, object],
+    outputs_of_interest: list[str],
+    use_driver: bool,
+    seed: OutputSeed | None,
+) -> dict[str, object]:
+    """Assign ``input_values`` on the session, solve through ``run_cycle`` and build the point's result."""
+
+    record = session_manager.get_record(session_id)
+    if seed is not None:
+        _restore_outputs(record.problem, seed)
+        record.last_run_generation = None
+    for var_name, var_value in input_values.items():
+        record.problem.set_val(var_name, var_value)
+        record.mark_inputs_changed()
+    run_result = run_cycle(
+        {
+            "session_id": session_id,
+            "outputs_of_interest": outputs_of_interest,
+            "use_driver": use_driver,
+        }
+    )
+    success = not run_result.get("error") and bool(run_result.get("success"))
+    return {
+        "inputs": input_values,
+        "success": success,
+        "outputs": run_result.get("outputs", {}),
+        "messages": run_result.get("messages", []),
+        "error_message": (None if success else str(run_result.get("error"))),
+    }
+
+
+def _failed_point(input_values: dict[str, object], exc: BaseException) -> dict[str, object]:
+    """Result recorded for a point whose inputs could not be assigned under ``skip_on_failure``."""
+
+    return {"inputs": input_values, "success": False, "outputs": {}, "messages": [], "error_message": str(exc)}
+
+
+def _evaluate_point(input_values: dict[str, object], outputs_of_interest: list[str]) -> dict[str, object]:
+    """Solve one point on the worker's session."""
+
+    if _WORKER_SESSION is None:
+        raise RuntimeError("sweep worker was not initialized")
+    return _sweep_point(_WORKER_SESSION, input_values, outputs_of_interest, False, _WORKER_SEED)
+
+
+def _sweep_parallel(
+    session_id: str,
+    problem_snapshot: bytes,
+    points: list[dict[str, object]],
+    outputs_of_interest: list[str],
+    workers: int,
+    skip_on_failure: bool,
+    seed: OutputSeed | None,
+) -> dict[str, object]:
+    """Evaluate all but the last point on spawned workers while the session itself solves the last one."""
+
+    *remote_points, last_point = points
+    results: list[dict[str, object]] = []
+    initargs = (problem_snapshot, seed is not None)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=initargs,
+    ) as pool:
+        futures: list[Future[dict[str, object]]] = [
+            pool.submit(_evaluate_point, point, outputs_of_interest) for point in remote_points
+        ]
+        last_outcome: dict[str, object] | Exception
+        try:
+            last_outcome = _sweep_point(session_id, last_point, outputs_of_interest, False, seed)
+        except Exception as exc:
+            last_outcome = exc
+        for point, future in zip(remote_points, futures, strict=True):
+            failure = future.exception()
+            if failure is None:
+                results.append(future.result())
+            elif skip_on_failure:
+                results.append(_failed_point(point, failure))
+            else:
+                for pending in futures:
+                    pending.cancel()
+                return to_error(failure if isinstance(failure, Exception) else RuntimeError(str(failure)))
+    if isinstance(last_outcome, Exception):
+        if not skip_on_failure:
+            return to_error(last_outcome)
+        last_outcome = _failed_point(last_point, last_outcome)
+    results.append(last_outcome)
+    return {"results": results}
+
+
+def _problem_snapshot(record: SessionRecord) -> bytes | None:
+    """Pickle the session's problem for worker processes, or ``None`` if it cannot be."""
+
+    try:
+        return pickle.dumps(record.problem)
+    except Exception as exc:
+        LOGGER.info("Problem is not picklable, sweeping serially: %s", exc)
+        return None
+
+
+def _axis_values(values: object) -> list[object]:
+    """Normalize one axis's ``values`` to a list of points; arrays iterate along axis 0."""
+
+    if isinstance(values, np.ndarray):
+        points: list[object] = values.tolist() if values.ndim else [values.item()]
+        return points
+    return values if isinstance(values, list) else []
+
 
 def sweep_inputs(payload: dict[str, object]) -> dict[str, object]:
     """Perform a parametric sweep over input variables."""
@@ -18,6 +197,9 @@ def sweep_inputs(payload: dict[str, object]) -> dict[str, object]:
     outputs_of_interest: list[str] = outputs_raw if isinstance(outputs_raw, list) else []
     use_driver = bool(payload.get("use_driver", False))
     skip_on_failure = bool(payload.get("skip_on_failure", True))
+    workers_raw = payload.get("parallel_workers", 1)
+    parallel_workers = int(workers_raw) if isinstance(workers_raw, (int, str)) else 1
+    reset_between_points = bool(payload.get("reset_between_points", True))
 
     if not session_id:
         return error_response("ValidationError", "session_id is required")
@@ -25,48 +207,33 @@ def sweep_inputs(payload: dict[str, object]) -> dict[str, object]:
         return error_response("ValidationError", "sweep must include at least one variable")
 
     try:
-        problem, _ = session_manager.get(str(session_id))
+        record = session_manager.get_record(str(session_id))
         variables = [entry.get("name") for entry in sweep_spec if isinstance(entry, dict)]
-        value_sets = [
-            entry.get("values", []) if isinstance(entry.get("values"), list) else []
-            for entry in sweep_spec
-            if isinstance(entry, dict)
-        ]
+        value_sets = [_axis_values(entry.get("values")) for entry in sweep_spec if isinstance(entry, dict)]
+        if not all(value_sets):
+            return {"results": []}
+        point_count = math.prod(len(values) for values in value_sets)
+        points = (
+            {name: value for name, value in zip(variables, combination, strict=False) if isinstance(name, str)}
+            for combination in ordered_cartesian_product(value_sets)
+        )
+
+        seed = _snapshot_outputs(record) if reset_between_points and not use_driver else None
+        if parallel_workers > 1 and reset_between_points and not use_driver and point_count > 1:
+            snapshot = _problem_snapshot(record)
+            if snapshot is not None:
+                workers = min(parallel_workers, MAX_PARALLEL_WORKERS, os.cpu_count() or 1, point_count - 1)
+                return _sweep_parallel(
+                    str(session_id), snapshot, list(points), outputs_of_interest, workers, skip_on_failure, seed
+                )
 
         results: list[dict[str, object]] = []
-        for value_combo in ordered_cartesian_product(value_sets):
-            input_values = {
-                name: value for name, value in zip(variables, value_combo, strict=False) if isinstance(name, str)
-            }
+        for input_values in points:
             try:
-                for var_name, var_value in input_values.items():
-                    problem.set_val(var_name, var_value)
-                run_result = run_cycle(
-                    {
-                        "session_id": session_id,
-                        "outputs_of_interest": outputs_of_interest,
-                        "use_driver": use_driver,
-                    }
-                )
-                success = not run_result.get("error") and bool(run_result.get("success"))
-                results.append(
-                    {
-                        "inputs": input_values,
-                        "success": success,
-                        "outputs": run_result.get("outputs", {}),
-                        "error_message": (None if success else str(run_result.get("error"))),
-                    }
-                )
+                results.append(_sweep_point(str(session_id), input_values, outputs_of_interest, use_driver, seed))
             except Exception as exc:
                 if skip_on_failure:
-                    results.append(
-                        {
-                            "inputs": input_values,
-                            "success": False,
-                            "outputs": {},
-                            "error_message": str(exc),
-                        }
-                    )
+                    results.append(_failed_point(input_values, exc))
                     continue
                 return to_error(exc)
 
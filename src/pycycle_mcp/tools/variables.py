@@ -2,11 +2,45 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+from collections.abc import Callable, Iterator
+
+import numpy as np
+
 from ..errors import error_response, to_error
-from ..session_manager import session_manager
+from ..session_manager import SessionRecord, session_manager
 from ..utils import error_on_missing_session, render_variable_entry
 
 
+@functools.lru_cache(maxsize=128)
+def _name_matcher(name_filter: str) -> Callable[[str], bool]:
+    """Return a case-insensitive substring predicate for ``name_filter``."""
+
+    needle = name_filter.lower()
+
+    def _matches(name: str) -> bool:
+        return needle in name.lower()
+
+    return _matches
+
+
+def _iter_entries(
+    record: SessionRecord, kind: str, promoted_only: bool, matches: Callable[[str], bool] | None
+) -> Iterator[dict[str, object]]:
+    """Yield rendered inputs then outputs, lazily so callers can stop at a cap."""
+
+    for target, io in (("inputs", "input"), ("outputs", "output")):
+        if kind not in (target, "both"):
+            continue
+        for name, metadata in record.variable_listing(target):
+            if promoted_only and metadata.get("promoted_name") not in (None, name):
+                continue
+            if matches is not None and not matches(name):
+                continue
+            yield render_variable_entry(name, metadata, io)
+
+
 def list_variables(payload: dict[str, object]) -> dict[str, object]:
     """List variables in the cycle model."""
 
@@ -17,30 +51,18 @@ def list_variables(payload: dict[str, object]) -> dict[str, object]:
     kind = payload.get("kind", "both")
     promoted_only = payload.get("promoted_only", True)
     name_filter = payload.get("name_filter")
+    matches = _name_matcher(str(name_filter)) if name_filter else None
     max_variables_raw = payload.get("max_variables", 200)
     max_variables = int(max_variables_raw) if isinstance(max_variables_raw, (int, str)) else 200
 
     try:
-        problem, _ = session_manager.get(str(session_id))
-        results: list[dict[str, object]] = []
-
-        if kind in ("inputs", "both"):
-            for name, metadata in problem.model.list_inputs(prom_name=True, out_stream=None):
-                if promoted_only and metadata.get("promoted_name") not in (None, name):
-                    continue
-                if name_filter and str(name_filter).lower() not in name.lower():
-                    continue
-                results.append(render_variable_entry(name, metadata, "input"))
-
-        if kind in ("outputs", "both"):
-            for name, metadata in problem.model.list_outputs(prom_name=True, out_stream=None):
-                if promoted_only and metadata.get("promoted_name") not in (None, name):
-                    continue
-                if name_filter and str(name_filter).lower() not in name.lower():
-                    continue
-                results.append(render_variable_entry(name, metadata, "output"))
-
-        return {"variables": results[:max_variables]}
+        record = session_manager.get_record(str(session_id))
+        entries = _iter_entries(record, str(kind), bool(promoted_only), matches)
+        if max_variables >= 0:
+            results = list(itertools.islice(entries, max_variables))
+        else:
+            results = list(entries)[:max_variables]
+        return {"variables": results}
     except KeyError as exc:
         return error_on_missing_session(str(session_id), exc)
     except Exception as exc:  # pragma: no cover
@@ -60,13 +82,14 @@ def set_inputs(payload: dict[str, object]) -> dict[str, object]:
         return error_response("ValidationError", "values must contain at least one entry")
 
     try:
-        problem, _ = session_manager.get(str(session_id))
+        record = session_manager.get_record(str(session_id))
         updated: list[str] = []
         skipped: list[dict[str, str]] = []
 
         for name, value in values.items():
             try:
-                problem.set_val(name, value)
+                record.problem.set_val(name, value)
+                record.mark_inputs_changed()
                 updated.append(name)
             except Exception as exc:
                 if allow_missing:
@@ -94,14 +117,14 @@ def get_outputs(payload: dict[str, object]) -> dict[str, object]:
         return error_response("ValidationError", "names must contain at least one entry")
 
     try:
-        problem, _ = session_manager.get(str(session_id))
+        record = session_manager.get_record(str(session_id))
         values: dict[str, object] = {}
         missing: list[str] = []
 
         for name in names:
             try:
-                current = problem.get_val(name)
-                values[name] = current.item() if hasattr(current, "item") else current
+                current = record.problem.get_val(name)
+                values[name] = current.item() if isinstance(current, (np.ndarray, np.generic)) else current
             except Exception:
                 if allow_missing:
                     missing.append(name)
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import importlib
+import itertools
 import logging
-from collections.abc import Callable, Iterable, Sequence
+import re
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import cast
 
 from .errors import error_response
@@ -35,15 +37,11 @@ def error_on_missing_session(session_id: str, exc: Exception) -> dict[str, objec
     )
 
 
-def select_interesting_variables(variables: list[tuple[str, dict[str, object]]], keywords: Iterable[str]) -> list[str]:
-    """Select promoted names containing any keyword in a case-insensitive fashion."""
+def keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile keywords into one alternation meant to be searched against lowercased names."""
 
-    selected: list[str] = []
-    for name, _ in variables:
-        lowered = name.lower()
-        if any(keyword.lower() in lowered for keyword in keywords):
-            selected.append(name)
-    return selected
+    alternatives = "|".join(re.escape(keyword.lower()) for keyword in keywords)
+    return re.compile(alternatives or "(?!)")
 
 
 def render_variable_entry(name: str, metadata: dict[str, object], io: str) -> dict[str, object]:
@@ -69,16 +67,9 @@ def _normalize_shape(shape: object | None) -> object | None:
     return shape
 
 
-def ordered_cartesian_product(values: Sequence[Sequence[object]]) -> list[list[object]]:
-    """Return nested-loop ordering for a Cartesian product."""
+def ordered_cartesian_product(values: Sequence[Sequence[object]]) -> Iterator[tuple[object, ...]]:
+    """Lazily yield combinations in nested-loop order (the last group varies fastest)."""
 
     if not values:
-        return []
-    results: list[list[object]] = [[]]
-    for group in values:
-        next_results: list[list[object]] = []
-        for prefix in results:
-            for item in group:
-                next_results.append(prefix + [item])
-        results = next_results
-    return results
+        return iter(())
+    return itertools.product(*values)
@@ -1,6 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import os
+from collections.abc import Callable, Coroutine, Iterator
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+from pycycle_mcp.session_manager import session_manager
+from pycycle_mcp.types import CycleProblem
+
+if TYPE_CHECKING:
+    from fastmcp.server import FastMCP
+    from fastmcp.tools import Tool
+
+# Keep the suite (and the subprocesses it spawns) from touching the user's schema cache.
+os.environ.setdefault("PYCYCLE_MCP_SCHEMA_CACHE", "0")
+
+RunAsync = Callable[[Coroutine[Any, Any, Any]], Any]
+CallTool = Callable[[str, dict[str, Any]], Any]
 
 
 @dataclass
@@ -22,6 +42,11 @@ class DummyModel:
 
 class DummyProblem:
     def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Return to the freshly constructed state."""
+
         self.model: DummyModel = DummyModel()
         self.values: dict[str, object] = {}
         self.iter_count: int = 0
@@ -53,3 +78,115 @@ class DummyProblem:
 
     def compute_totals(self, of: list[str], wrt: list[str]) -> dict[tuple[str, str], object]:
         return {(o, w): [[1.0]] for o in of for w in wrt}
+
+
+@pytest.fixture(autouse=True)
+def _close_leaked_sessions() -> Iterator[None]:
+    """Close global sessions a test opened so workers reusing one process do not accumulate them."""
+
+    before = set(session_manager.session_ids())
+    yield
+    for session_id in set(session_manager.session_ids()) - before:
+        session_manager.close(session_id)
+
+
+@pytest.fixture(scope="session")
+def fastmcp_server_instance() -> FastMCP:
+    """One server for the whole run; wrappers resolve tool functions at call time, so monkeypatching still applies."""
+
+    from pycycle_mcp.fastmcp_server import build_server
+
+    return build_server()
+
+
+@pytest.fixture(scope="session")
+def run_async() -> Iterator[RunAsync]:
+    """Run coroutines on one event loop shared by the whole session instead of a fresh loop per call."""
+
+    with asyncio.Runner() as runner:
+        yield runner.run
+
+
+async def _call(server: FastMCP, name: str, arguments: dict[str, Any]) -> Any:
+    tool = await server.get_tool(name)
+    return await tool.run(arguments)
+
+
+@pytest.fixture(scope="session")
+def call_tool(fastmcp_server_instance: FastMCP, run_async: RunAsync) -> CallTool:
+    """Fetch and run a tool on the shared server in a single loop entry."""
+
+    return lambda name, arguments: run_async(_call(fastmcp_server_instance, name, arguments))
+
+
+@pytest.fixture(scope="session")
+def compute_totals_tool(fastmcp_server_instance: FastMCP, run_async: RunAsync) -> Tool:
+    """The shared server's ``compute_totals`` tool, resolved once for schema introspection tests."""
+
+    return run_async(fastmcp_server_instance.get_tool("compute_totals"))
+
+
+class ThrustProblem(DummyProblem):
+    """Solves ``Fn = 100 * Mach``, so ``Fn`` always reflects the last solved point."""
+
+    def run_model(self) -> None:
+        super().run_model()
+        self.values["Fn"] = 100.0 * cast(float, self.values.get("Mach", 0.0))
+
+
+class RejectingProblem(DummyProblem):
+    """Rejects negative assignments, so sweep points can fail before their solve."""
+
+    def set_val(self, name: str | None = None, value: object | None = None, **kwargs: object) -> None:
+        if isinstance(value, float) and value < 0:
+            raise ValueError(f"{name} must be non-negative, got {value}")
+        super().set_val(name, value, **kwargs)
+
+
+@pytest.fixture
+def exec_comp_problem(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Set-up real OpenMDAO problem solving ``Fn = 100 * Mach``; skips when OpenMDAO is not installed."""
+
+    om = pytest.importorskip("openmdao.api")
+    # OpenMDAO writes a ``<problem>_out`` directory into the working directory.
+    monkeypatch.chdir(tmp_path)
+    problem = om.Problem()
+    problem.model.add_subsystem("perf", om.ExecComp("Fn = 100.0 * Mach"), promotes=["*"])
+    problem.setup()
+    return problem
+
+
+DUMMY_INPUTS: tuple[tuple[str, dict[str, object]], ...] = (
+    ("Mach", {"promoted_name": "Mach", "units": "", "desc": "Mach number", "val": 0.0}),
+)
+DUMMY_OUTPUTS: tuple[tuple[str, dict[str, object]], ...] = (
+    ("Fn", {"promoted_name": "Fn", "units": "lbf", "desc": "Thrust", "val": 0.0}),
+)
+
+
+def _list_dummy_variables(problem: DummyProblem) -> None:
+    problem.model.inputs = list(DUMMY_INPUTS)
+    problem.model.outputs = list(DUMMY_OUTPUTS)
+
+
+@pytest.fixture(scope="module")
+def _module_dummy_session() -> Iterator[str]:
+    problem = DummyProblem()
+    _list_dummy_variables(problem)
+    session_id = session_manager.create_session(
+        problem=cast(CycleProblem, problem), meta={"mode": "design", "options": {}}
+    )
+    yield session_id
+    session_manager.close(session_id)
+
+
+@pytest.fixture
+def dummy_session(_module_dummy_session: str) -> Iterator[str]:
+    """Session on a ``DummyProblem`` with ``Mach``/``Fn`` listed, shared per module and reset after each test."""
+
+    record = session_manager.get_record(_module_dummy_session)
+    yield _module_dummy_session
+    problem = cast(DummyProblem, record.problem)
+    problem.reset()
+    _list_dummy_variables(problem)
+    record.reset()
@@ -32,60 +32,48 @@ def test_build_parser_defaults_to_stdio_transport() -> None:
     assert args.path is None
 
 
-def test_main_runs_fastmcp_with_transport(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        pytest.param(
+            ["--transport", "http", "--host", "127.0.0.1", "--port", "8080", "--path", "/mcp"],
+            {
+                "transport": "streamable-http",
+                "host": "127.0.0.1",
+                "port": 8080,
+                "path": "/mcp",
+                "log_level": "INFO",
+                "show_banner": False,
+            },
+            id="http-normalized",
+        ),
+        pytest.param(
+            ["--transport", "stdio"],
+            {"transport": "stdio", "show_banner": False, "log_level": "INFO"},
+            id="stdio-no-network-kwargs",
+        ),
+        pytest.param(
+            ["--transport", "sse", "--log-level", "DEBUG"],
+            {"transport": "sse", "host": "0.0.0.0", "port": 8000, "show_banner": False, "log_level": "DEBUG"},
+            id="sse-custom-log-level",
+        ),
+    ],
+)
+def test_main_runs_fastmcp_with_transport(
+    monkeypatch: pytest.MonkeyPatch, argv: list[str], expected: dict[str, object]
+) -> None:
     """main() delegates to FastMCP.run with normalized transport settings."""
     dummy_app = _DummyApp()
     monkeypatch.setattr(server_main, "build_server", lambda: dummy_app)
 
-    exit_code = server_main.main(
-        [
-            "--transport",
-            "http",
-            "--host",
-            "127.0.0.1",
-            "--port",
-            "8080",
-            "--path",
-            "/mcp",
-        ]
-    )
+    exit_code = server_main.main(argv)
 
     assert exit_code == 0
-    assert dummy_app.run_calls == [
-        {
-            "transport": "streamable-http",
-            "host": "127.0.0.1",
-            "port": 8080,
-            "path": "/mcp",
-            "log_level": "INFO",
-            "show_banner": False,
-        }
-    ]
-
-
-def test_main_stdio_uses_non_network_transport_kwargs(monkeypatch: pytest.MonkeyPatch) -> None:
-    dummy_app = _DummyApp()
-    monkeypatch.setattr(server_main, "build_server", lambda: dummy_app)
+    assert dummy_app.run_calls == [expected]
 
-    exit_code = server_main.main(["--transport", "stdio"])
 
-    assert exit_code == 0
-    assert dummy_app.run_calls == [{"transport": "stdio", "show_banner": False, "log_level": "INFO"}]
+def test_build_server_defers_to_fastmcp_factory() -> None:
+    """The CLI-level factory returns the fully registered FastMCP app."""
+    app = server_main.build_server()
 
-
-def test_main_forwards_custom_log_level(monkeypatch: pytest.MonkeyPatch) -> None:
-    dummy_app = _DummyApp()
-    monkeypatch.setattr(server_main, "build_server", lambda: dummy_app)
-
-    exit_code = server_main.main(["--transport", "sse", "--log-level", "DEBUG"])
-
-    assert exit_code == 0
-    assert dummy_app.run_calls == [
-        {
-            "transport": "sse",
-            "host": "0.0.0.0",
-            "port": 8000,
-            "show_banner": False,
-            "log_level": "DEBUG",
-        }
-    ]
+    assert app.name == "pycycle-mcp"
@@ -61,6 +61,17 @@ def test_get_cycle_summary(monkeypatch: pytest.MonkeyPatch) -> None:
     assert key_outputs[0]["name"] == "Fn"
 
 
+def test_get_cycle_summary_reports_zero_and_legacy_values() -> None:
+    problem = DummyProblem()
+    problem.model.inputs = [("fc.MN", {"val": 0.0}), ("fc.alt", {"value": 35000.0})]
+    session_id = session_manager.create_session(problem=cast(CycleProblem, problem), meta={})
+
+    response = create_model.get_cycle_summary({"session_id": session_id})
+
+    key_inputs = cast(list[dict[str, object]], response["key_inputs"])
+    assert [entry["current_value"] for entry in key_inputs] == [0.0, 35000.0]
+
+
 def test_create_cycle_model_missing_fields() -> None:
     response = create_model.create_cycle_model({"cycle_type": "turbofan"})
     assert "error" in response
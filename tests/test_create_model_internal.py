@@ -112,8 +112,9 @@ class _OpenMDAOProblem(_RecorderProblem):
 
 
 def test_build_problem_import_error_when_openmdao_missing(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delitem(sys.modules, "openmdao", raising=False)
-    monkeypatch.delitem(sys.modules, "openmdao.api", raising=False)
+    # ``None`` in sys.modules makes the import fail even when OpenMDAO is installed.
+    monkeypatch.setitem(sys.modules, "openmdao", None)
+    monkeypatch.setitem(sys.modules, "openmdao.api", None)
 
     with pytest.raises(ImportError):
         create_model._build_problem(lambda: _FakeModel(), "design", {})
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from pycycle_mcp.errors import MCPError, error_response, to_error
+
+
+def test_error_helpers_match_typed_envelope() -> None:
+    expected = MCPError(error_type="ValidationError", message="bad input", details={"field": "x"}).to_response()
+
+    assert error_response("ValidationError", "bad input", {"field": "x"}) == expected
+    assert to_error(KeyError("missing")) == MCPError(error_type="KeyError", message="'missing'").to_response()
+
+
+def test_mcp_error_instances_have_no_dict() -> None:
+    error = MCPError(error_type="ValidationError", message="bad input")
+
+    assert not hasattr(error, "__dict__")
@@ -1,49 +1,133 @@
 from __future__ import annotations
 
-import anyio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastmcp.tools import Tool
 from pytest import MonkeyPatch
 
 from pycycle_mcp import fastmcp_server
 
+from .conftest import CallTool, RunAsync
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_importing_server_module_defers_heavy_imports() -> None:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(REPO_ROOT / "src")
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pycycle_mcp.fastmcp_server, pycycle_mcp.tools; "
+            "print('fastmcp' in sys.modules, 'mcp.types' in sys.modules, 'numpy' in sys.modules)",
+        ],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.split() == ["False", "False", "False"]
+
+
+def test_importing_server_module_does_not_generate_or_write_schemas(tmp_path: Path) -> None:
+    env = dict(os.environ)
+    env.update(PYTHONPATH=str(REPO_ROOT / "src"), PYCYCLE_MCP_SCHEMA_CACHE="1", PYCYCLE_MCP_CACHE_DIR=str(tmp_path))
+    completed = subprocess.run(
+        [sys.executable, "-c", "import pycycle_mcp.fastmcp_server as s; print(s._schemas.cache_info().currsize)"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.split() == ["0"]
+    assert list(tmp_path.iterdir()) == []
+
 
-def test_build_server_exposes_schemas() -> None:
-    server = fastmcp_server.build_server()
+def test_tools_package_resolves_lazy_attributes() -> None:
+    from pycycle_mcp.tools import execution, run_cycle
 
-    tool = anyio.run(server.get_tool, "compute_totals")
+    assert run_cycle is execution.run_cycle
+    with pytest.raises(AttributeError):
+        fastmcp_server.tools.not_a_tool  # noqa: B018
 
-    assert tool.output_schema is not None
-    assert tool.output_schema["type"] == "object"
-    assert "jacobian" in tool.output_schema.get("properties", {})
 
+def test_build_server_exposes_schemas(compute_totals_tool: Tool) -> None:
+    assert compute_totals_tool.output_schema is not None
+    assert compute_totals_tool.output_schema["type"] == "object"
+    assert "jacobian" in compute_totals_tool.output_schema.get("properties", {})
 
-def test_ping_tool_is_registered() -> None:
-    server = fastmcp_server.build_server()
 
-    tool = anyio.run(server.get_tool, "ping")
-    result = anyio.run(tool.run, {})
+def test_response_schemas_are_computed_once(run_async: RunAsync) -> None:
+    fastmcp_server._prewarm_schemas()
+    first = fastmcp_server.build_server()
+    second = fastmcp_server.build_server()
+
+    first_tool = run_async(first.get_tool("run_cycle"))
+    second_tool = run_async(second.get_tool("run_cycle"))
+
+    assert first_tool.output_schema == second_tool.output_schema
+    assert fastmcp_server._schema.cache_info().currsize == len(fastmcp_server._RESPONSE_MODELS)
+    assert first_tool.annotations is second_tool.annotations
+    assert first_tool.annotations is not None
+    assert first_tool.annotations.title == "Run cycle"
+
+
+def test_response_schemas_round_trip_through_disk_cache(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("PYCYCLE_MCP_SCHEMA_CACHE", "1")
+    monkeypatch.setenv("PYCYCLE_MCP_CACHE_DIR", str(tmp_path))
+    fastmcp_server._schemas.cache_clear()
+    try:
+        generated = fastmcp_server._schemas()
+        (cache_file,) = tmp_path.glob("schemas.*.json")
+
+        fastmcp_server._schemas.cache_clear()
+        with monkeypatch.context() as patched:
+            patched.setattr(
+                fastmcp_server.PingResponse,
+                "model_json_schema",
+                classmethod(lambda cls: pytest.fail("schema regenerated despite cache")),
+            )
+            assert fastmcp_server._schemas() == generated
+
+        cache_file.write_text("not json", encoding="utf-8")
+        fastmcp_server._schemas.cache_clear()
+        assert fastmcp_server._schemas() == generated
+    finally:
+        fastmcp_server._schemas.cache_clear()
+
+
+def test_ping_tool_is_registered(call_tool: CallTool) -> None:
+    result = call_tool("ping", {})
 
     assert result.structured_content is not None
     assert result.structured_content["server"] == "pycycle-mcp"
 
 
-def test_create_cycle_model_wrapper_returns_structured(
-    monkeypatch: MonkeyPatch,
-) -> None:
-    def fake_create(payload: dict[str, object]) -> dict[str, object]:
-        assert payload["cycle_type"] == "custom"
-        return {
-            "session_id": "abc123",
-            "model_name": "demo",
-            "top_promoted_inputs": [],
-            "top_promoted_outputs": [],
-        }
+def _fake_create_cycle_model(payload: dict[str, object]) -> dict[str, object]:
+    assert payload["cycle_type"] == "custom"
+    return {
+        "session_id": "abc123",
+        "model_name": "demo",
+        "top_promoted_inputs": [],
+        "top_promoted_outputs": [],
+    }
 
-    monkeypatch.setattr(fastmcp_server.tools.create_model, "create_cycle_model", fake_create)
-    server = fastmcp_server.build_server()
-    tool = anyio.run(server.get_tool, "create_cycle_model")
 
-    result = anyio.run(
-        tool.run,
+def test_create_cycle_model_wrapper_returns_structured(monkeypatch: MonkeyPatch, call_tool: CallTool) -> None:
+    monkeypatch.setattr(fastmcp_server.tools.create_model, "create_cycle_model", _fake_create_cycle_model)
+    result = call_tool(
+        "create_cycle_model",
         {
             "cycle_type": "custom",
             "mode": "design",
@@ -57,9 +141,43 @@ def test_create_cycle_model_wrapper_returns_structured(
     assert result.structured_content["model_name"] == "demo"
 
 
-def test_all_tool_wrappers_return_validated_structured_content(
-    monkeypatch: MonkeyPatch,
+def test_sweep_wrapper_passes_plain_dict_payload(monkeypatch: MonkeyPatch, call_tool: CallTool) -> None:
+    captured: list[dict[str, object]] = []
+
+    def fake_sweep(payload: dict[str, object]) -> dict[str, object]:
+        captured.append(payload)
+        return {"results": []}
+
+    monkeypatch.setattr(fastmcp_server.tools.sweep, "sweep_inputs", fake_sweep)
+    call_tool("sweep_inputs", {"session_id": "s", "sweep": [{"name": "Mach", "values": [0.7, 0.8]}]})
+
+    assert captured == [
+        {
+            "session_id": "s",
+            "sweep": [{"name": "Mach", "values": [0.7, 0.8]}],
+            "outputs_of_interest": [],
+            "use_driver": False,
+            "skip_on_failure": True,
+            "parallel_workers": 1,
+            "reset_between_points": True,
+        }
+    ]
+
+
+@pytest.mark.parametrize("workers", [0, 33])
+def test_sweep_wrapper_rejects_out_of_range_parallel_workers(
+    monkeypatch: MonkeyPatch, call_tool: CallTool, workers: int
 ) -> None:
+    captured: list[dict[str, object]] = []
+    monkeypatch.setattr(fastmcp_server.tools.sweep, "sweep_inputs", captured.append)
+
+    with pytest.raises(Exception, match="parallel_workers"):
+        call_tool("sweep_inputs", {"session_id": "s", "sweep": [], "parallel_workers": workers})
+
+    assert captured == []
+
+
+def test_all_tool_wrappers_return_validated_structured_content(monkeypatch: MonkeyPatch, call_tool: CallTool) -> None:
     monkeypatch.setattr(
         fastmcp_server.tools.create_model,
         "close_cycle_model",
@@ -107,43 +225,29 @@ def test_all_tool_wrappers_return_validated_structured_content(
         lambda payload: {"jacobian": {}, "messages": []},
     )
 
-    server = fastmcp_server.build_server()
-
-    close_tool = anyio.run(server.get_tool, "close_cycle_model")
-    summary_tool = anyio.run(server.get_tool, "get_cycle_summary")
-    list_tool = anyio.run(server.get_tool, "list_variables")
-    set_tool = anyio.run(server.get_tool, "set_inputs")
-    get_tool = anyio.run(server.get_tool, "get_outputs")
-    run_tool = anyio.run(server.get_tool, "run_cycle")
-    sweep_tool = anyio.run(server.get_tool, "sweep_inputs")
-    totals_tool = anyio.run(server.get_tool, "compute_totals")
-
-    assert anyio.run(close_tool.run, {"session_id": "s"}).structured_content == {"success": True}
-    assert anyio.run(summary_tool.run, {"session_id": "s"}).structured_content == {
+    assert call_tool("close_cycle_model", {"session_id": "s"}).structured_content == {"success": True}
+    assert call_tool("get_cycle_summary", {"session_id": "s"}).structured_content == {
         "model_name": "demo",
         "mode": "design",
         "options": {},
         "key_inputs": [],
         "key_outputs": [],
     }
-    assert anyio.run(
-        list_tool.run,
-        {"session_id": "s", "kind": "both", "promoted_only": True, "max_variables": 5},
+    assert call_tool(
+        "list_variables", {"session_id": "s", "kind": "both", "promoted_only": True, "max_variables": 5}
     ).structured_content == {"variables": []}
-    assert anyio.run(
-        set_tool.run,
-        {"session_id": "s", "values": {"Mach": 0.8}, "allow_missing": True},
+    assert call_tool(
+        "set_inputs", {"session_id": "s", "values": {"Mach": 0.8}, "allow_missing": True}
     ).structured_content == {"updated": [], "skipped": []}
-    assert anyio.run(get_tool.run, {"session_id": "s", "names": ["Fn"], "allow_missing": True}).structured_content == {
+    assert call_tool("get_outputs", {"session_id": "s", "names": ["Fn"], "allow_missing": True}).structured_content == {
         "values": {},
         "missing": [],
     }
-    assert anyio.run(
-        run_tool.run,
-        {"session_id": "s", "outputs_of_interest": ["Fn"], "use_driver": False},
+    assert call_tool(
+        "run_cycle", {"session_id": "s", "outputs_of_interest": ["Fn"], "use_driver": False}
     ).structured_content == {"success": True, "outputs": {}, "messages": []}
-    assert anyio.run(
-        sweep_tool.run,
+    assert call_tool(
+        "sweep_inputs",
         {
             "session_id": "s",
             "sweep": [{"name": "Mach", "values": [0.7, 0.8]}],
@@ -152,7 +256,6 @@ def test_all_tool_wrappers_return_validated_structured_content(
             "skip_on_failure": True,
         },
     ).structured_content == {"results": []}
-    assert anyio.run(
-        totals_tool.run,
-        {"session_id": "s", "of": ["Fn"], "wrt": ["Mach"], "return_format": "by_pair"},
+    assert call_tool(
+        "compute_totals", {"session_id": "s", "of": ["Fn"], "wrt": ["Mach"], "return_format": "by_pair"}
     ).structured_content == {"jacobian": {}, "messages": []}
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+from logging.handlers import QueueHandler
+
+import pytest
 
 from pycycle_mcp import runtime
 
@@ -46,3 +49,47 @@ def test_configure_logging_uses_basic_config(monkeypatch) -> None:
 
     assert captured["level"] == "DEBUG"
     assert "%(asctime)s" in str(captured["format"])
+
+
+def test_configure_logging_unbuffered_skips_queue(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, object] = {}
+    monkeypatch.setenv("PYCYCLE_MCP_LOG_UNBUFFERED", "1")
+    monkeypatch.setattr(logging, "basicConfig", lambda **kwargs: captured.update(kwargs))
+
+    runtime.configure_logging("INFO")
+
+    assert captured == {"level": "INFO", "format": runtime.LOG_FORMAT}
+
+
+def test_configure_logging_routes_records_through_queue_listener(monkeypatch: pytest.MonkeyPatch) -> None:
+    listeners: list[_FakeListener] = []
+
+    class _FakeListener:
+        def __init__(self, log_queue: object, *handlers: logging.Handler) -> None:
+            self.queue = log_queue
+            self.handlers = handlers
+            self.started = False
+            listeners.append(self)
+
+        def start(self) -> None:
+            self.started = True
+
+        def stop(self) -> None:
+            self.started = False
+
+    root = logging.getLogger()
+    stop_callbacks: list[object] = []
+    monkeypatch.delenv("PYCYCLE_MCP_LOG_UNBUFFERED", raising=False)
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.setattr(runtime, "QueueListener", _FakeListener)
+    monkeypatch.setattr(runtime.atexit, "register", stop_callbacks.append)
+
+    runtime.configure_logging("WARNING")
+
+    assert len(root.handlers) == 1
+    assert isinstance(root.handlers[0], QueueHandler)
+    assert root.level == logging.WARNING
+    assert listeners[0].started is True
+    assert isinstance(listeners[0].handlers[0], logging.StreamHandler)
+    assert stop_callbacks == [listeners[0].stop]
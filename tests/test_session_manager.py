@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import cast
 
-from pycycle_mcp.session_manager import SessionManager
+import pytest
+
+from pycycle_mcp.session_manager import SessionManager, SessionRecord
 from pycycle_mcp.types import CycleProblem
 
 from .conftest import DummyProblem
@@ -16,11 +18,84 @@ def test_session_lifecycle() -> None:
 
     assert problem is problem_obj
     assert meta["mode"] == "design"
+    assert manager.session_ids() == [session_id]
 
     manager.close(session_id)
-    try:
+    assert manager.session_ids() == []
+    with pytest.raises(KeyError, match=session_id):
         manager.get(session_id)
-    except KeyError:
-        assert True
-    else:  # pragma: no cover - safety
-        raise AssertionError("Expected session to be removed")
+
+
+def test_session_ids_are_unique_and_close_is_idempotent() -> None:
+    manager = SessionManager()
+    problem_obj = cast(CycleProblem, DummyProblem())
+    session_ids = {manager.create_session(problem=problem_obj) for _ in range(50)}
+
+    assert len(session_ids) == 50
+    for session_id in session_ids:
+        manager.close(session_id)
+        manager.close(session_id)
+
+
+class _CleanupProblem(DummyProblem):
+    def __init__(self) -> None:
+        super().__init__()
+        self.cleaned_up = False
+
+    def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+def test_least_recently_used_session_is_evicted(caplog: pytest.LogCaptureFixture) -> None:
+    closed: list[str] = []
+
+    def record_close(session_id: str, record: SessionRecord) -> None:
+        del record
+        closed.append(session_id)
+
+    manager = SessionManager(max_sessions=2, on_close=record_close)
+    first = manager.create_session(problem=cast(CycleProblem, DummyProblem()))
+    second = manager.create_session(problem=cast(CycleProblem, DummyProblem()))
+    manager.get(first)
+    third = manager.create_session(problem=cast(CycleProblem, DummyProblem()))
+
+    assert closed == [second]
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+    assert second in caplog.records[0].getMessage()
+    manager.get(first)
+    manager.get(third)
+    with pytest.raises(KeyError):
+        manager.get(second)
+
+
+def test_reset_clears_caches_and_solve_bookkeeping() -> None:
+    record = SessionRecord(problem=cast(CycleProblem, DummyProblem()))
+    record.mark_inputs_changed()
+    record.last_run_generation = record.inputs_generation
+    record.totals_for(["Fn"], ["Mach"], lambda: {("Fn", "Mach"): 1.0})
+    record.variable_listing("inputs")
+    assert record.totals and record.variables
+
+    record.reset()
+
+    assert (record.variables, dict(record.totals)) == ({}, {})
+    assert (record.inputs_generation, record.last_run_generation) == (0, None)
+
+
+def test_close_releases_problem_resources() -> None:
+    manager = SessionManager(max_sessions=0)
+    problem = _CleanupProblem()
+    session_id = manager.create_session(problem=cast(CycleProblem, problem))
+
+    manager.close(session_id)
+
+    assert problem.cleaned_up is True
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("5", 5), ("0", 0), ("", 32), ("lots", 32), ("-1", 32)])
+def test_max_sessions_env_falls_back_to_default_on_invalid_values(
+    monkeypatch: pytest.MonkeyPatch, raw: str, expected: int
+) -> None:
+    monkeypatch.setenv("PYCYCLE_MCP_MAX_SESSIONS", raw)
+
+    assert SessionManager()._max_sessions == expected
@@ -1,40 +1,274 @@
 from __future__ import annotations
 
-from typing import cast
+import base64
+import pickle
+from typing import Any, cast
+
+import numpy as np
+import pytest
 
 from pycycle_mcp.session_manager import session_manager
-from pycycle_mcp.tools import derivatives, sweep
+from pycycle_mcp.tools import derivatives, execution, sweep, variables
 from pycycle_mcp.types import CycleProblem
 
-from .conftest import DummyProblem
+from .conftest import DummyProblem, RejectingProblem, ThrustProblem
 
 
-def test_sweep_inputs_success() -> None:
-    problem = DummyProblem()
-    problem.model.inputs = [("Mach", {"promoted_name": "Mach"})]
-    session_id = session_manager.create_session(
-        problem=cast(CycleProblem, problem), meta={"mode": "design", "options": {}}
+def test_sweep_inputs_success(dummy_session: str) -> None:
+    session_id = dummy_session
+
+    mach_values = np.linspace(0.7, 0.8, 16)
+
+    result = sweep.sweep_inputs(
+        {
+            "session_id": session_id,
+            "sweep": [{"name": "Mach", "values": mach_values}],
+            "outputs_of_interest": ["Fn"],
+        }
     )
 
+    results = cast(list[dict[str, object]], result["results"])
+    assert [entry["success"] for entry in results] == [True] * 16
+    assert [entry["inputs"] for entry in results] == [{"Mach": value} for value in mach_values.tolist()]
+    assert all(type(cast(dict[str, object], entry["inputs"])["Mach"]) is float for entry in results)
+
+
+def test_sweep_treats_2d_arrays_like_nested_lists(dummy_session: str) -> None:
+    def swept_inputs(values: object) -> list[object]:
+        result = sweep.sweep_inputs(
+            {"session_id": dummy_session, "sweep": [{"name": "bleeds", "values": values}], "outputs_of_interest": []}
+        )
+        return [entry["inputs"] for entry in cast(list[dict[str, object]], result["results"])]
+
+    rows = [[1.0, 2.0], [3.0, 4.0]]
+
+    assert swept_inputs(np.array(rows)) == swept_inputs(rows) == [{"bleeds": [1.0, 2.0]}, {"bleeds": [3.0, 4.0]}]
+
+
+def test_sweep_inputs_orders_multi_axis_combinations(dummy_session: str) -> None:
+    session_id = dummy_session
+
     result = sweep.sweep_inputs(
         {
             "session_id": session_id,
-            "sweep": [{"name": "Mach", "values": [0.7, 0.8]}],
+            "sweep": [{"name": "Mach", "values": [0.7, 0.8]}, {"name": "alt", "values": [0.0, 1000.0]}],
+            "outputs_of_interest": ["Mach"],
+        }
+    )
+
+    results = cast(list[dict[str, object]], result["results"])
+    assert [entry["inputs"] for entry in results] == [
+        {"Mach": 0.7, "alt": 0.0},
+        {"Mach": 0.7, "alt": 1000.0},
+        {"Mach": 0.8, "alt": 0.0},
+        {"Mach": 0.8, "alt": 1000.0},
+    ]
+
+
+def test_sweep_resolves_revisited_points_and_leaves_session_at_last_point() -> None:
+    problem = ThrustProblem()
+    session_id = session_manager.create_session(problem=cast(CycleProblem, problem), meta={})
+
+    result = sweep.sweep_inputs(
+        {
+            "session_id": session_id,
+            "sweep": [{"name": "Mach", "values": [0.5, 0.25, 0.5]}],
             "outputs_of_interest": ["Fn"],
         }
     )
 
     results = cast(list[dict[str, object]], result["results"])
-    assert len(results) == 2
-    assert all(bool(entry["success"]) for entry in results)
+    assert [entry["outputs"] for entry in results] == [{"Fn": 50.0}, {"Fn": 25.0}, {"Fn": 50.0}]
+    assert problem.iter_count == 3
+    assert variables.get_outputs({"session_id": session_id, "names": ["Fn"]})["values"] == {"Fn": 50.0}
+
+
+def test_parallel_sweep_matches_serial_results_and_final_session_state() -> None:
+    def run_sweep(**options: object) -> tuple[dict[str, object], DummyProblem]:
+        problem = DummyProblem()
+        session_id = session_manager.create_session(problem=cast(CycleProblem, problem), meta={})
+        result = sweep.sweep_inputs(
+            {
+                "session_id": session_id,
+                "sweep": [{"name": "Mach", "values": [0.7, 0.8]}, {"name": "alt", "values": [0.0, 1000.0]}],
+                "outputs_of_interest": ["Mach", "alt", "Fn"],
+                **options,
+            }
+        )
+        final = variables.get_outputs({"session_id": session_id, "names": ["Mach", "alt"]})
+        assert final["values"] == {"Mach": 0.8, "alt": 1000.0}
+        return result, problem
+
+    serial, _ = run_sweep()
+    parallel, parallel_problem = run_sweep(parallel_workers=2)
+
+    assert parallel == serial
+    results = cast(list[dict[str, object]], parallel["results"])
+    assert all(entry["messages"] == ["Ran model", "Missing output Fn: 'Fn'"] for entry in results)
+    assert parallel_problem.iter_count == 1
+
+
+@pytest.mark.parametrize("mach_values", [[-1.0, 0.7, 0.8], [0.7, 0.8, -1.0]], ids=["worker_point", "last_point"])
+@pytest.mark.parametrize("skip_on_failure", [True, False])
+def test_parallel_sweep_reports_failing_points_like_serial(mach_values: list[float], skip_on_failure: bool) -> None:
+    def run_sweep(**options: object) -> dict[str, object]:
+        session_id = session_manager.create_session(problem=cast(CycleProblem, RejectingProblem()), meta={})
+        return sweep.sweep_inputs(
+            {
+                "session_id": session_id,
+                "sweep": [{"name": "Mach", "values": mach_values}],
+                "outputs_of_interest": ["Mach"],
+                "skip_on_failure": skip_on_failure,
+                **options,
+            }
+        )
+
+    serial = run_sweep()
+    if skip_on_failure:
+        failed = [entry for entry in cast(list[dict[str, object]], serial["results"]) if not entry["success"]]
+        assert [entry["error_message"] for entry in failed] == ["Mach must be non-negative, got -1.0"]
+    else:
+        assert serial == {
+            "error": {"type": "ValueError", "message": "Mach must be non-negative, got -1.0", "details": None}
+        }
+
+    assert run_sweep(parallel_workers=2) == serial
+
+
+def test_worker_entry_points_solve_on_a_worker_local_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sweep, "_WORKER_SESSION", None)
+    monkeypatch.setattr(sweep, "_WORKER_SEED", None)
+    with pytest.raises(RuntimeError, match="not initialized"):
+        sweep._evaluate_point({"Mach": 0.7}, ["Mach"])
+
+    sweep._init_worker(pickle.dumps(ThrustProblem()), True)
+
+    assert sweep._evaluate_point({"Mach": 0.7}, ["Fn"]) == {
+        "inputs": {"Mach": 0.7},
+        "success": True,
+        "outputs": {"Fn": 70.0},
+        "messages": ["Ran model"],
+        "error_message": None,
+    }
 
 
-def test_compute_totals_formats_by_pair() -> None:
+def test_parallel_sweep_falls_back_to_serial_for_unpicklable_problems() -> None:
     problem = DummyProblem()
-    session_id = session_manager.create_session(
-        problem=cast(CycleProblem, problem), meta={"mode": "design", "options": {}}
+    problem.values["callback"] = lambda: None
+    session_id = session_manager.create_session(problem=cast(CycleProblem, problem), meta={})
+
+    result = sweep.sweep_inputs(
+        {
+            "session_id": session_id,
+            "sweep": [{"name": "Mach", "values": [0.7, 0.8]}],
+            "outputs_of_interest": ["Mach"],
+            "parallel_workers": 2,
+        }
     )
 
+    results = cast(list[dict[str, object]], result["results"])
+    assert [entry["outputs"] for entry in results] == [{"Mach": 0.7}, {"Mach": 0.8}]
+    assert problem.iter_count == 2
+
+
+class _ContinuationProblem(DummyProblem):
+    """Problem whose converged state depends on where the previous solve ended."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.model.outputs = [("state", {})]
+        self.values["state"] = 0.0
+
+    def run_model(self) -> None:
+        super().run_model()
+        self.values["state"] = cast(float, self.values["state"]) + cast(float, self.values["Mach"])
+
+
+def test_sweep_resets_solver_seed_between_points_by_default() -> None:
+    def run_sweep(**options: object) -> list[object]:
+        session_id = session_manager.create_session(problem=cast(CycleProblem, _ContinuationProblem()), meta={})
+        result = sweep.sweep_inputs(
+            {
+                "session_id": session_id,
+                "sweep": [{"name": "Mach", "values": [1.0, 2.0]}],
+                "outputs_of_interest": ["state"],
+                **options,
+            }
+        )
+        return [entry["outputs"] for entry in cast(list[dict[str, object]], result["results"])]
+
+    assert run_sweep() == [{"state": 1.0}, {"state": 2.0}]
+    assert run_sweep(reset_between_points=False) == [{"state": 1.0}, {"state": 3.0}]
+
+
+def test_parallel_sweep_without_seed_reset_runs_serially_so_points_chain() -> None:
+    problem = _ContinuationProblem()
+    session_id = session_manager.create_session(problem=cast(CycleProblem, problem), meta={})
+
+    result = sweep.sweep_inputs(
+        {
+            "session_id": session_id,
+            "sweep": [{"name": "Mach", "values": [1.0, 2.0, 3.0, 4.0]}],
+            "outputs_of_interest": ["state"],
+            "reset_between_points": False,
+            "parallel_workers": 2,
+        }
+    )
+
+    results = cast(list[dict[str, object]], result["results"])
+    assert [entry["outputs"] for entry in results] == [{"state": 1.0}, {"state": 3.0}, {"state": 6.0}, {"state": 10.0}]
+    assert problem.iter_count == 4
+
+
+@pytest.mark.integration_real
+def test_sweep_seed_reset_round_trips_a_real_openmdao_output_vector(exec_comp_problem: Any) -> None:
+    problem = exec_comp_problem
+    problem.set_val("Mach", 0.5)
+    problem.run_model()
+    record = session_manager.get_record(session_manager.create_session(problem=cast(CycleProblem, problem)))
+    seed = sweep._snapshot_outputs(record)
+    assert isinstance(seed, np.ndarray)
+
+    problem.set_val("Mach", 0.9)
+    problem.run_model()
+    sweep._restore_outputs(record.problem, seed)
+
+    assert problem.get_val("Fn") == pytest.approx(50.0)
+
+
+@pytest.mark.integration_real
+def test_parallel_sweep_of_a_real_openmdao_problem_matches_serial(exec_comp_problem: Any) -> None:
+    session_id = session_manager.create_session(problem=cast(CycleProblem, exec_comp_problem))
+    request: dict[str, object] = {
+        "session_id": session_id,
+        "sweep": [{"name": "Mach", "values": [0.5, 0.7, 0.9]}],
+        "outputs_of_interest": ["Fn"],
+    }
+
+    serial = sweep.sweep_inputs(request)
+    parallel = sweep.sweep_inputs({**request, "parallel_workers": 2})
+
+    results = cast(list[dict[str, object]], serial["results"])
+    assert [entry["outputs"] for entry in results] == [{"Fn": 50.0}, {"Fn": 70.0}, {"Fn": 90.0}]
+    assert parallel == serial
+
+
+def test_sweep_with_an_empty_axis_returns_no_results_without_running() -> None:
+    problem = DummyProblem()
+    session_id = session_manager.create_session(problem=cast(CycleProblem, problem), meta={})
+
+    result = sweep.sweep_inputs(
+        {"session_id": session_id, "sweep": [{"name": "Mach", "values": [0.7, 0.8]}, {"name": "alt", "values": []}]}
+    )
+
+    assert result == {"results": []}
+    assert problem.iter_count == 0
+    assert sweep.sweep_inputs({"session_id": "missing", "sweep": [{"name": "alt", "values": []}]})["error"]
+
+
+def test_compute_totals_formats_by_pair(dummy_session: str) -> None:
+    session_id = dummy_session
+
     result = derivatives.compute_totals(
         {
             "session_id": session_id,
@@ -47,3 +281,82 @@ def test_compute_totals_formats_by_pair() -> None:
     jacobian = cast(dict[str, dict[str, object]], result["jacobian"])
     assert "Fn" in jacobian
     assert jacobian["Fn"]["Mach"] == [[1.0]]
+
+
+def test_compute_totals_dense_assembles_blocks_and_encodes_base64() -> None:
+    class _VectorTotalsProblem(DummyProblem):
+        def compute_totals(self, of: list[str], wrt: list[str]) -> dict[tuple[str, str], object]:
+            sizes = {"Fn": 2, "TSFC": 1, "Mach": 1, "alt": 3}
+            return {(o, w): np.full((sizes[o], sizes[w]), float(len(o) + len(w))) for o in of for w in wrt}
+
+    session_id = session_manager.create_session(problem=cast(CycleProblem, _VectorTotalsProblem()), meta={})
+    request = {"session_id": session_id, "of": ["Fn", "TSFC"], "wrt": ["Mach", "alt"]}
+
+    dense = cast(dict[str, object], derivatives.compute_totals({**request, "return_format": "dense"})["jacobian"])
+    encoded = cast(
+        dict[str, object], derivatives.compute_totals({**request, "return_format": "dense_base64"})["jacobian"]
+    )
+
+    assert dense["shape"] == [3, 4]
+    assert dense["of_sizes"] == [2, 1]
+    assert dense["wrt_sizes"] == [1, 3]
+    assert dense["data"] == [[6.0, 5.0, 5.0, 5.0], [6.0, 5.0, 5.0, 5.0], [8.0, 7.0, 7.0, 7.0]]
+    decoded = np.frombuffer(base64.b64decode(cast(str, encoded["data_b64"])), dtype=encoded["dtype"])
+    assert decoded.reshape(cast(list[int], encoded["shape"])).tolist() == dense["data"]
+
+
+def test_compute_totals_caches_only_the_jacobian_of_the_current_solve() -> None:
+    class _CountingTotalsProblem(ThrustProblem):
+        def __init__(self) -> None:
+            super().__init__()
+            self.linearized_at: list[object] = []
+
+        def compute_totals(self, of: list[str], wrt: list[str]) -> dict[tuple[str, str], object]:
+            self.linearized_at.append(self.values.get("Fn"))
+            return super().compute_totals(of, wrt)
+
+    problem = _CountingTotalsProblem()
+    session_id = session_manager.create_session(problem=cast(CycleProblem, problem), meta={})
+    request = {"session_id": session_id, "of": ["Fn"], "wrt": ["Mach"]}
+
+    def solve_at(mach: float) -> None:
+        variables.set_inputs({"session_id": session_id, "values": {"Mach": mach}})
+        execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Fn"]})
+
+    assert derivatives.compute_totals(request)["messages"] == ["Totals computed"]
+    assert derivatives.compute_totals(request)["messages"] == ["Totals computed"]
+    assert problem.linearized_at == [None, None]
+
+    solve_at(0.5)
+    first = derivatives.compute_totals({**request, "return_format": "by_pair"})
+    dense = derivatives.compute_totals({**request, "return_format": "dense"})
+    assert first["messages"] == ["Totals computed"]
+    assert dense["messages"] == ["Reused cached totals"]
+    assert cast(dict[str, object], dense["jacobian"])["data"] == [[1.0]]
+
+    variables.set_inputs({"session_id": session_id, "values": {"Mach": 0.25}})
+    assert derivatives.compute_totals(request)["messages"] == ["Totals computed"]
+    solve_at(0.25)
+    derivatives.compute_totals(request)
+    solve_at(0.5)
+    assert derivatives.compute_totals(request)["messages"] == ["Totals computed"]
+    assert problem.linearized_at == [None, None, 50.0, 50.0, 25.0, 50.0]
+
+
+def test_serial_sweep_generates_points_lazily() -> None:
+    class _RejectingProblem(DummyProblem):
+        def set_val(self, name: str | None = None, value: object | None = None, **kwargs: object) -> None:
+            raise ValueError(f"cannot set {name}")
+
+    session_id = session_manager.create_session(problem=cast(CycleProblem, _RejectingProblem()), meta={})
+    axis = list(range(1000))
+
+    result = sweep.sweep_inputs(
+        {
+            "session_id": session_id,
+            "sweep": [{"name": "a", "values": axis}, {"name": "b", "values": axis}, {"name": "c", "values": axis}],
+            "skip_on_failure": False,
+        }
+    )
+
+    assert result["error"] == {"type": "ValueError", "message": "cannot set a", "details": None}
@@ -192,7 +192,14 @@ def test_compute_totals_validation_dense_and_missing_session_paths() -> None:
     dense_response = derivatives.compute_totals(
         {"session_id": session_id, "of": ["Fn"], "wrt": ["Mach"], "return_format": "dense"}
     )
-    assert dense_response["jacobian"] == {"of": ["Fn"], "wrt": ["Mach"], "data": [[[[1.0]]]]}
+    assert dense_response["jacobian"] == {
+        "of": ["Fn"],
+        "wrt": ["Mach"],
+        "of_sizes": [1],
+        "wrt_sizes": [1],
+        "shape": [1, 1],
+        "data": [[1.0]],
+    }
 
     missing_response = derivatives.compute_totals({"session_id": "missing", "of": ["Fn"], "wrt": ["Mach"]})
     assert missing_response["error"]["type"] == "KeyError"
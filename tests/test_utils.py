@@ -23,4 +23,16 @@ def test_load_callable_invalid_path_and_non_callable(monkeypatch: pytest.MonkeyP
 def test_normalize_shape_and_cartesian_empty() -> None:
     assert utils._normalize_shape((2, 3)) == [2, 3]
     assert utils._normalize_shape(5) == 5
-    assert utils.ordered_cartesian_product([]) == []
+    assert list(utils.ordered_cartesian_product([])) == []
+
+
+def test_ordered_cartesian_product_varies_last_group_fastest() -> None:
+    assert list(utils.ordered_cartesian_product([["a", "b"], [1, 2]])) == [("a", 1), ("a", 2), ("b", 1), ("b", 2)]
+
+
+def test_keyword_pattern_matches_lowercased_names_and_escapes_keywords() -> None:
+    names = ["fc.MN", "fan.PR", "perf.Fn", "a+b"]
+
+    assert [name for name in names if utils.keyword_pattern(["pr", "FN"]).search(name.lower())] == ["fan.PR", "perf.Fn"]
+    assert [name for name in names if utils.keyword_pattern(["+"]).search(name.lower())] == ["a+b"]
+    assert not any(utils.keyword_pattern([]).search(name.lower()) for name in names)
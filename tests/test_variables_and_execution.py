@@ -1,28 +1,20 @@
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
+
+import numpy as np
+import pytest
+from pytest import MonkeyPatch
 
 from pycycle_mcp.session_manager import session_manager
 from pycycle_mcp.tools import execution, variables
 from pycycle_mcp.types import CycleProblem
 
-from .conftest import DummyProblem
-
-
-def setup_dummy_session() -> str:
-    problem = DummyProblem()
-    problem.model.inputs = [
-        (
-            "Mach",
-            {"promoted_name": "Mach", "units": "", "desc": "Mach number", "val": 0.0},
-        )
-    ]
-    problem.model.outputs = [("Fn", {"promoted_name": "Fn", "units": "lbf", "desc": "Thrust", "val": 0.0})]
-    return session_manager.create_session(problem=cast(CycleProblem, problem), meta={"mode": "design", "options": {}})
+from .conftest import DummyProblem, ThrustProblem
 
 
-def test_set_and_get_inputs() -> None:
-    session_id = setup_dummy_session()
+def test_set_and_get_inputs(dummy_session: str) -> None:
+    session_id = dummy_session
 
     set_response = variables.set_inputs({"session_id": session_id, "values": {"Mach": 0.75}})
     assert set_response["updated"] == ["Mach"]
@@ -32,8 +24,8 @@ def test_set_and_get_inputs() -> None:
     assert variables_payload[0]["name"] == "Mach"
 
 
-def test_run_cycle_and_get_outputs() -> None:
-    session_id = setup_dummy_session()
+def test_run_cycle_and_get_outputs(dummy_session: str) -> None:
+    session_id = dummy_session
 
     run_response = execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Fn"]})
     assert run_response["success"] is True
@@ -48,7 +40,126 @@ def test_run_cycle_and_get_outputs() -> None:
     assert values["Fn"] == 123.4
 
 
-def test_get_outputs_missing_allowed() -> None:
-    session_id = setup_dummy_session()
+def test_get_outputs_missing_allowed(dummy_session: str) -> None:
+    session_id = dummy_session
     response = variables.get_outputs({"session_id": session_id, "names": ["Missing"], "allow_missing": True})
     assert response["missing"] == ["Missing"]
+
+
+def test_list_variables_name_filter_is_case_insensitive_and_cached(dummy_session: str) -> None:
+    session_id = dummy_session
+
+    response = variables.list_variables({"session_id": session_id, "kind": "both", "name_filter": "MAC"})
+    names = [entry["name"] for entry in cast(list[dict[str, object]], response["variables"])]
+
+    assert names == ["Mach"]
+    assert variables._name_matcher("MAC") is variables._name_matcher("MAC")
+
+
+def test_variable_listings_are_cached_until_values_change(monkeypatch: MonkeyPatch, dummy_session: str) -> None:
+    session_id = dummy_session
+    problem, _ = session_manager.get(session_id)
+    assert isinstance(problem, DummyProblem)
+    calls: list[str] = []
+    original_list_inputs = problem.model.list_inputs
+
+    def counting_list_inputs(prom_name: bool = True, out_stream: object | None = None) -> object:
+        calls.append("inputs")
+        return original_list_inputs(prom_name=prom_name, out_stream=out_stream)
+
+    monkeypatch.setattr(problem.model, "list_inputs", counting_list_inputs)
+
+    variables.list_variables({"session_id": session_id, "kind": "inputs"})
+    variables.list_variables({"session_id": session_id, "kind": "inputs"})
+    assert calls == ["inputs"]
+
+    variables.set_inputs({"session_id": session_id, "values": {"Mach": 0.75}})
+    variables.list_variables({"session_id": session_id, "kind": "inputs"})
+    execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Fn"]})
+    variables.list_variables({"session_id": session_id, "kind": "inputs"})
+    assert calls == ["inputs"] * 3
+
+
+@pytest.mark.integration_real
+def test_run_cycle_and_get_outputs_track_a_real_openmdao_problem_across_setup(exec_comp_problem: Any) -> None:
+    problem = exec_comp_problem
+    session_id = session_manager.create_session(problem=cast(CycleProblem, problem), meta={})
+
+    variables.set_inputs({"session_id": session_id, "values": {"Mach": 0.7}})
+    first = execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Fn"]})
+    problem.setup()
+    variables.set_inputs({"session_id": session_id, "values": {"Mach": 0.8}})
+    second = execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Fn"]})
+
+    assert first["outputs"] == {"Fn": pytest.approx(70.0)}
+    assert second["outputs"] == {"Fn": pytest.approx(80.0)}
+    fetched = variables.get_outputs({"session_id": session_id, "names": ["Fn"]})
+    assert fetched["values"] == {"Fn": pytest.approx(80.0)}
+
+
+def test_run_cycle_skips_solve_when_inputs_unchanged(dummy_session: str) -> None:
+    session_id = dummy_session
+    problem, _ = session_manager.get(session_id)
+    assert isinstance(problem, DummyProblem)
+
+    execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Fn"]})
+    unchanged = execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Mach"]})
+    assert problem.iter_count == 1
+    assert unchanged["messages"] == ["Model inputs unchanged since last run", "Missing output Mach: 'Mach'"]
+
+    variables.set_inputs({"session_id": session_id, "values": {"Mach": 0.75}})
+    rerun = execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Mach"]})
+    assert problem.iter_count == 2
+    assert rerun["outputs"] == {"Mach": 0.75}
+
+    execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Mach"], "use_driver": True})
+    assert problem.iter_count == 3
+
+
+def test_revisited_point_is_solved_again_so_outputs_match_the_problem_state() -> None:
+    problem = ThrustProblem()
+    session_id = session_manager.create_session(problem=cast(CycleProblem, problem), meta={})
+
+    for mach in (0.5, 0.25, 0.5):
+        variables.set_inputs({"session_id": session_id, "values": {"Mach": mach}})
+        response = execution.run_cycle({"session_id": session_id, "outputs_of_interest": ["Fn"]})
+
+    assert response == {"success": True, "outputs": {"Fn": 50.0}, "messages": ["Ran model"]}
+    assert problem.iter_count == 3
+    assert variables.get_outputs({"session_id": session_id, "names": ["Fn"]})["values"] == {"Fn": 50.0}
+
+
+def test_get_outputs_unwraps_numpy_scalars_and_single_element_arrays(dummy_session: str) -> None:
+    session_id = dummy_session
+    problem, _ = session_manager.get(session_id)
+    assert isinstance(problem, DummyProblem)
+    problem.values.update({"Fn": np.array([5.0]), "TSFC": np.float64(0.5), "label": "cruise"})
+
+    response = variables.get_outputs({"session_id": session_id, "names": ["Fn", "TSFC", "label"]})
+
+    assert response["values"] == {"Fn": 5.0, "TSFC": 0.5, "label": "cruise"}
+    assert type(cast(dict[str, object], response["values"])["Fn"]) is float
+
+
+def test_list_variables_stops_rendering_at_max_variables(monkeypatch: MonkeyPatch, dummy_session: str) -> None:
+    session_id = dummy_session
+    problem, _ = session_manager.get(session_id)
+    assert isinstance(problem, DummyProblem)
+    problem.model.inputs = [(f"in{index}", {}) for index in range(5)]
+    rendered: list[str] = []
+    original_render = variables.render_variable_entry
+
+    def recording_render(name: str, metadata: dict[str, object], io: str) -> dict[str, object]:
+        rendered.append(name)
+        return original_render(name, metadata, io)
+
+    def fail_list_outputs(prom_name: bool = True, out_stream: object | None = None) -> object:
+        raise AssertionError("outputs should not be listed once the cap is reached")
+
+    monkeypatch.setattr(variables, "render_variable_entry", recording_render)
+    monkeypatch.setattr(problem.model, "list_outputs", fail_list_outputs)
+
+    response = variables.list_variables({"session_id": session_id, "kind": "both", "max_variables": 2})
+
+    assert [entry["name"] for entry in cast(list[dict[str, object]], response["variables"])] == ["in0", "in1"]
+    assert rendered == ["in0", "in1"]